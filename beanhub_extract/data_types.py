@@ -3,7 +3,7 @@ import datetime
 import decimal
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Transaction:
     extractor: str
     # the filename of import source
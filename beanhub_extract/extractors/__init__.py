@@ -1,6 +1,10 @@
+import concurrent.futures
 import os
+import pathlib
 import typing
 
+from ..data_types import Transaction
+
 from .ally_bank_ofx import AllyBankOFXExtractor
 from .bac_san_jose_bank import BacSanJoseBankExtractor
 from .bac_san_jose_credit import BacSanJoseCreditExtractor
@@ -54,3 +58,24 @@ def detect_extractor(input_file: typing.TextIO) -> typing.Type[ExtractorBase]:
         input_file.seek(os.SEEK_SET)
         if extractor_cls(input_file).detect():
             return extractor_cls
+
+
+def _extract_file(path: str | pathlib.Path) -> list[Transaction]:
+    with open(path, "rt") as input_file:
+        extractor_cls = detect_extractor(input_file)
+        if extractor_cls is None:
+            return []
+        input_file.seek(os.SEEK_SET)
+        return list(extractor_cls(input_file)())
+
+
+def extract_batch(
+    paths: typing.Iterable[str | pathlib.Path],
+    max_workers: int | None = None,
+) -> typing.Generator[Transaction, None, None]:
+    """Detect and extract transactions from multiple files in parallel processes,
+    yielding them in the order of the given paths. Files without a matching extractor are skipped.
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for transactions in executor.map(_extract_file, paths, chunksize=4):
+            yield from transactions
@@ -7,13 +7,24 @@ import typing
 
 from ..data_types import Fingerprint
 from ..data_types import Transaction
+from ..utils import split_slash_date
 from .base import ExtractorBase
 
+# Start tags with attributes, quoted attribute values may contain ">"
+TAG_ATTRIBUTES_PATTERN = re.compile(
+    r"""<([a-zA-Z][a-zA-Z0-9]*)(?:\s+[^\s/>"'=]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'>]+))?)+\s*>"""
+)
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+# IBAN style account number, "CR" followed by 20 digits
+ACCOUNT_NUMBER_PATTERN = re.compile(r"CR\d{20}")
+# Characters read by detect(), enough for statements with large inline styles in <head>
+DETECT_HEAD_SIZE = 64 * 1024
+
 
 def parse_date(date_str: str) -> datetime.date:
     """Parse DD/MM/YYYY date format used by Banco BCR."""
-    parts = date_str.strip().split("/")
-    return datetime.date(int(parts[2]), int(parts[1]), int(parts[0]))
+    day, month, year = split_slash_date(date_str.strip())
+    return datetime.date(year, month, day)
 
 
 class BancoBcrHTMLParser(html.parser.HTMLParser):
@@ -44,7 +55,8 @@ class BancoBcrHTMLParser(html.parser.HTMLParser):
     def handle_endtag(self, tag):
         if tag == "td" and self._in_td:
             self._in_td = False
-            self._current_row.append(self._current_cell_data.strip())
+            # Clean each cell once here, so rows are ready to use as-is
+            self._current_row.append(self._current_cell_data.replace('&nbsp;', '').strip())
         elif tag == "tr" and self._current_row:
             self._process_row()
             
@@ -79,7 +91,7 @@ class BancoBcrHTMLParser(html.parser.HTMLParser):
                 self._partial_account = ""
             self._partial_account += data
             # Check if we have a complete account number (CR + 20 digits)
-            cr_match = re.search(r'CR\d{20}', self._partial_account)
+            cr_match = ACCOUNT_NUMBER_PATTERN.search(self._partial_account)
             if cr_match:
                 self.account_number = cr_match.group()
                 
@@ -94,8 +106,7 @@ class BancoBcrHTMLParser(html.parser.HTMLParser):
         """Process a completed table row."""
         if len(self._current_row) == 7:
             # Check if this looks like a transaction row (has dates and amounts)
-            fecha_contable = self._current_row[0].strip().replace('&nbsp;', '').strip()
-            fecha_transaccion = self._current_row[1].strip().replace('&nbsp;', '').strip()
+            fecha_contable, fecha_transaccion, hora, documento, descripcion, debitos, creditos = self._current_row
             
             # Skip header rows and empty rows
             if (fecha_contable and fecha_transaccion and 
@@ -106,11 +117,11 @@ class BancoBcrHTMLParser(html.parser.HTMLParser):
                 self.transactions.append({
                     "fecha_contable": fecha_contable,
                     "fecha_transaccion": fecha_transaccion,
-                    "hora": self._current_row[2].strip().replace('&nbsp;', ''),
-                    "documento": self._current_row[3].strip().replace('&nbsp;', ''),
-                    "descripcion": self._current_row[4].strip().replace('&nbsp;', ''),
-                    "debitos": self._current_row[5].strip().replace('&nbsp;', ''),
-                    "creditos": self._current_row[6].strip().replace('&nbsp;', ''),
+                    "hora": hora,
+                    "documento": documento,
+                    "descripcion": descripcion,
+                    "debitos": debitos,
+                    "creditos": creditos,
                 })
 
 
@@ -118,11 +129,18 @@ class BancoBcrExtractor(ExtractorBase):
     EXTRACTOR_NAME = "banco_bcr"
     DEFAULT_IMPORT_ID = "banco_bcr:{{ source_account }}:{{ transaction_id }}"
 
+    def __init__(self, input_file: typing.TextIO):
+        super().__init__(input_file)
+        # (input_file, parser) from the last parse
+        self._parsed = None
+
     def detect(self) -> bool:
         """Detect if this is a Banco BCR HTML file."""
         try:
             self.input_file.seek(0)
-            content = self.input_file.read()
+            # The markers all sit in the header rows above the transaction table, a bounded
+            # head leaves room for large inline styles without reading the whole statement
+            content = self.input_file.read(DETECT_HEAD_SIZE)
             self.input_file.seek(0)
             
             # Check for BCR-specific HTML content
@@ -147,11 +165,16 @@ class BancoBcrExtractor(ExtractorBase):
             first_transaction = parser.transactions[0]
             
             # Create hash from account and first transaction
-            hash_obj = hashlib.sha256()
-            hash_obj.update(parser.account_number.encode("utf8"))
-            hash_obj.update(first_transaction["fecha_transaccion"].encode("utf8"))
-            hash_obj.update(first_transaction["documento"].encode("utf8"))
-            hash_obj.update(first_transaction["descripcion"].encode("utf8"))
+            hash_obj = hashlib.sha256(
+                "".join(
+                    (
+                        parser.account_number,
+                        first_transaction["fecha_transaccion"],
+                        first_transaction["documento"],
+                        first_transaction["descripcion"],
+                    )
+                ).encode("utf8")
+            )
             
             return Fingerprint(
                 starting_date=parse_date(first_transaction["fecha_transaccion"]),
@@ -161,22 +184,30 @@ class BancoBcrExtractor(ExtractorBase):
             return None
 
     def _parse_html(self) -> BancoBcrHTMLParser:
-        """Parse the HTML content and return the parser with extracted data."""
+        """Parse the HTML content and return the parser with extracted data.
+        The result is reused on later calls for the same input file, so
+        fingerprint() and __call__ only parse it once.
+        """
+        if self._parsed is not None and self._parsed[0] is self.input_file:
+            return self._parsed[1]
+
         self.input_file.seek(0)
         content = self.input_file.read()
         
         parser = BancoBcrHTMLParser()
-        parser.feed(content)
+        # The parser never looks at attributes, dropping them up front in a single regex pass
+        # saves html.parser from tokenizing every class/align/width on each cell
+        parser.feed(TAG_ATTRIBUTES_PATTERN.sub(r"<\1>", content))
         
         # If account number wasn't found by the parser, try regex on the full content
         if not parser.account_number:
             # Remove HTML tags and look for account number
-            import re
-            clean_content = re.sub(r'<[^>]+>', '', content)
-            cr_match = re.search(r'CR\d{20}', clean_content)
+            clean_content = HTML_TAG_PATTERN.sub('', content)
+            cr_match = ACCOUNT_NUMBER_PATTERN.search(clean_content)
             if cr_match:
                 parser.account_number = cr_match.group()
         
+        self._parsed = (self.input_file, parser)
         return parser
 
     def __call__(self) -> typing.Generator[Transaction, None, None]:
@@ -197,31 +228,29 @@ class BancoBcrExtractor(ExtractorBase):
                 transaction_date = parse_date(txn_data["fecha_transaccion"])
                 post_date = parse_date(txn_data["fecha_contable"])
                 
-                # Parse amounts - BCR uses separate debit/credit columns
-                debitos = txn_data["debitos"].strip()
-                creditos = txn_data["creditos"].strip()
-                
-                # Determine transaction amount
-                amount = None
-                if debitos and debitos != "&nbsp;" and debitos != "":
-                    # Remove any negative sign and make it negative
+                # Parse amounts - BCR uses separate debit/credit columns, the parser
+                # already stripped the cells and removed &nbsp;
+                debitos = txn_data["debitos"]
+                if debitos:
+                    # Remove any negative sign, debits are made negative below
                     amount_str = debitos.replace("-", "").replace(",", "")
-                    if amount_str and amount_str != "0.00":
-                        amount = -decimal.Decimal(amount_str)
-                elif creditos and creditos != "&nbsp;" and creditos != "":
+                else:
                     # Credits are positive
-                    amount_str = creditos.replace(",", "")
-                    if amount_str and amount_str != "0.00":
-                        amount = decimal.Decimal(amount_str)
-                        
-                if amount is None:
+                    amount_str = txn_data["creditos"].replace(",", "")
+                if not amount_str or amount_str == "0.00":
                     continue  # Skip transactions with no amount
+                amount = decimal.Decimal(amount_str)
+                if debitos:
+                    amount = -amount
                     
                 # Create unique transaction_id using reference:datehour (timestamp-like)
                 reference = txn_data["documento"]
                 hora = txn_data["hora"]
-                date_str = transaction_date.strftime("%Y%m%d")
-                unique_transaction_id = f"{reference}:{date_str}{hora.replace(':', '')}"
+                # Format the YYYYMMDD part from the date components, much cheaper than strftime per row
+                unique_transaction_id = (
+                    f"{reference}:{transaction_date.year:04d}{transaction_date.month:02d}"
+                    f"{transaction_date.day:02d}{hora.replace(':', '')}"
+                )
                 
                 yield Transaction(
                     extractor=self.EXTRACTOR_NAME,
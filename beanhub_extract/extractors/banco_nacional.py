@@ -6,13 +6,24 @@ import typing
 
 from ..data_types import Fingerprint
 from ..data_types import Transaction
+from ..utils import split_slash_date
 from .base import ExtractorBase
 
+# Columns used by the extractor, rows are returned with their values in this order
+COLUMNS = [
+    "oficina",
+    "fechaMovimiento",
+    "numeroDocumento",
+    "debito",
+    "credito",
+    "descripcion",
+]
+
 
 def parse_date(date_str: str) -> datetime.date:
     """Parse DD/MM/YYYY date format used by Banco Nacional."""
-    parts = date_str.strip().split("/")
-    return datetime.date(int(parts[2]), int(parts[1]), int(parts[0]))
+    day, month, year = split_slash_date(date_str.strip())
+    return datetime.date(year, month, day)
 
 
 class BancoNacionalExtractor(ExtractorBase):
@@ -23,15 +34,13 @@ class BancoNacionalExtractor(ExtractorBase):
         """Detect if this is a Banco Nacional CSV file."""
         try:
             self.input_file.seek(0)
-            content = self.input_file.read()
+            # Only the header line is needed, skip any leading blank lines
+            header = self.input_file.readline()
+            while header and not header.strip():
+                header = self.input_file.readline()
             self.input_file.seek(0)
             
             # Check for semicolon-separated format and Spanish headers
-            lines = content.strip().split('\n')
-            if not lines:
-                return False
-                
-            header = lines[0]
             return (
                 ";" in header and
                 "oficina" in header.lower() and
@@ -51,45 +60,49 @@ class BancoNacionalExtractor(ExtractorBase):
             if not transactions:
                 return None
                 
-            first_transaction = transactions[0]
+            oficina, fecha_movimiento, numero_documento, _, _, descripcion = transactions[0]
             
             # Create hash from first transaction data
-            hash_obj = hashlib.sha256()
-            hash_obj.update(str(first_transaction["oficina"]).encode("utf8"))
-            hash_obj.update(first_transaction["fechaMovimiento"].encode("utf8"))
-            hash_obj.update(first_transaction["numeroDocumento"].encode("utf8"))
-            hash_obj.update(first_transaction["descripcion"].encode("utf8"))
+            hash_obj = hashlib.sha256(
+                "".join((oficina, fecha_movimiento, numero_documento, descripcion)).encode("utf8")
+            )
             
             return Fingerprint(
-                starting_date=parse_date(first_transaction["fechaMovimiento"]),
+                starting_date=parse_date(fecha_movimiento),
                 first_row_hash=hash_obj.hexdigest(),
             )
         except Exception:
             return None
 
-    def _parse_transactions(self) -> list[dict]:
-        """Parse transactions from the CSV file."""
+    def _parse_transactions(self) -> list[tuple[str | None, ...]]:
+        """Parse transactions from the CSV file.
+        Each row is a tuple of stripped values in COLUMNS order, with None for
+        values missing from the row.
+        """
         self.input_file.seek(0)
         
         # Use csv.reader with semicolon delimiter
-        reader = csv.DictReader(self.input_file, delimiter=';')
+        reader = csv.reader(self.input_file, delimiter=';')
+        header = next(reader, None)
+        if header is None:
+            return []
+        # Look up the column positions once from the header instead of building a dict per row
+        positions = {name.strip(): i for i, name in enumerate(header) if name}
+        indexes = [positions.get(column) for column in COLUMNS]
         transactions = []
         
         for row in reader:
+            row_length = len(row)
+            values = tuple(
+                row[index].strip() if index is not None and index < row_length else None
+                for index in indexes
+            )
             # Skip total/summary rows
-            if not row.get("fechaMovimiento") or row.get("fechaMovimiento").strip() == "":
+            if not values[1]:
                 continue
-            if "TOTAL" in row.get("numeroDocumento", "").upper():
+            if "TOTAL" in (values[2] or "").upper():
                 continue
-                
-            # Clean up the row data
-            cleaned_row = {}
-            for key, value in row.items():
-                if key and value is not None:
-                    cleaned_row[key.strip()] = value.strip()
-            
-            if cleaned_row:
-                transactions.append(cleaned_row)
+            transactions.append(values)
         
         return transactions
 
@@ -108,14 +121,14 @@ class BancoNacionalExtractor(ExtractorBase):
         for i, txn_row in enumerate(transactions):
             try:
                 # Parse transaction data
-                transaction_date = parse_date(txn_row["fechaMovimiento"])
-                oficina = txn_row["oficina"]
-                numero_documento = txn_row["numeroDocumento"]
-                descripcion = txn_row["descripcion"]
+                oficina, fecha_movimiento, numero_documento, debito_str, credito_str, descripcion = txn_row
+                if oficina is None or numero_documento is None or descripcion is None:
+                    raise ValueError(f"Transaction {i + 1} is missing columns")
+                transaction_date = parse_date(fecha_movimiento)
                 
                 # Parse amounts - Banco Nacional uses separate debit/credit columns
-                debito_str = txn_row.get("debito", "").strip()
-                credito_str = txn_row.get("credito", "").strip()
+                debito_str = debito_str or ""
+                credito_str = credito_str or ""
                 
                 # Determine transaction amount (negative for debits, positive for credits)
                 amount = None
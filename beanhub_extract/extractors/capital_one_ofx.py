@@ -1,6 +1,8 @@
 import datetime
 import decimal
+import functools
 import hashlib
+import re
 import typing
 from io import BytesIO
 
@@ -11,11 +13,15 @@ from ..data_types import Transaction
 from .base import ExtractorBase
 
 
+# The XML declaration, the <OFX> root and the Capital One ORG/FID always appear in this order
+DETECT_PATTERN = re.compile(r"<\?OFX.*?<OFX>.*?(?:<ORG>C1</ORG>|<FID>1001</FID>)", re.DOTALL)
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_ofx_datetime(dt_str: str) -> datetime.date:
     """Parse OFX datetime format (YYYYMMDDHHMMSS.sss) to date."""
-    # OFX datetime format is YYYYMMDDHHMMSS.sss, we only need the date part
-    date_part = dt_str[:8]  # YYYYMMDD
-    return datetime.datetime.strptime(date_part, "%Y%m%d").date()
+    # OFX datetime format is YYYYMMDDHHMMSS.sss, we only need the date part at fixed offsets
+    return datetime.date(int(dt_str[:4]), int(dt_str[4:6]), int(dt_str[6:8]))
 
 
 class CapitalOneOFXExtractor(ExtractorBase):
@@ -29,30 +35,26 @@ class CapitalOneOFXExtractor(ExtractorBase):
             content = self.input_file.read(1000)  # Read first 1000 chars
             self.input_file.seek(0)
             
-            # Check for OFX header and Capital One specific markers
-            return (
-                "<?OFX" in content and
-                "<OFX>" in content and
-                ("<ORG>C1</ORG>" in content or "<FID>1001</FID>" in content)
-            )
+            # Check for OFX header and Capital One specific markers in a single scan
+            return DETECT_PATTERN.search(content) is not None
         except Exception:
             return False
 
     def fingerprint(self) -> Fingerprint | None:
         """Generate fingerprint based on first and last transaction."""
         try:
-            transactions = list(self._parse_transactions())
-            if not transactions:
+            # Only the first transaction is needed, stop consuming the generator after it
+            first_txn = next(self._parse_transactions(), None)
+            if first_txn is None:
                 return None
             
-            # Use first transaction for fingerprint
-            first_txn = transactions[0]
-            
-            # Create hash from first transaction details
-            hash_obj = hashlib.sha256()
-            hash_obj.update(str(first_txn.get('FITID', '')).encode('utf-8'))
-            hash_obj.update(str(first_txn.get('TRNAMT', '')).encode('utf-8'))
-            hash_obj.update(str(first_txn.get('NAME', '')).encode('utf-8'))
+            # Create hash from first transaction details, joined so the digest matches incremental updates
+            hash_obj = hashlib.sha256(
+                "".join(
+                    str(first_txn.get(key, ""))
+                    for key in ("FITID", "TRNAMT", "NAME")
+                ).encode("utf-8")
+            )
             
             return Fingerprint(
                 starting_date=parse_ofx_datetime(first_txn['DTPOSTED']),
@@ -95,8 +97,7 @@ class CapitalOneOFXExtractor(ExtractorBase):
                 ledger_date = stmt.ledgerbal.dtasof.strftime('%Y%m%d%H%M%S')
 
             if hasattr(stmt, 'banktranlist') and stmt.banktranlist:
-                transactions = list(stmt.banktranlist)
-                for lineno, txn in enumerate(transactions, 1):
+                for lineno, txn in enumerate(stmt.banktranlist, 1):
                     # Validate required fields
                     if not hasattr(txn, 'dtposted'):
                         raise ValueError(f"Transaction {lineno} missing DTPOSTED")
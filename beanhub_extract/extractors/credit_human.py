@@ -7,19 +7,19 @@ import typing
 
 from ..data_types import Fingerprint
 from ..data_types import Transaction
+from ..utils import split_slash_date
 from .base import ExtractorBase
 
 
 def parse_date(date_str: str) -> datetime.date:
     """Parse MM/DD/YY date format."""
-    parts = date_str.split("/")
-    year = int(parts[2])
+    month, day, year = split_slash_date(date_str)
     # Handle 2-digit years - assume 20xx for years < 50, 19xx for years >= 50
     if year < 50:
         year += 2000
     else:
         year += 1900
-    return datetime.date(year, int(parts[0]), int(parts[1]))
+    return datetime.date(year, month, day)
 
 
 def parse_currency_amount(amount_str: str) -> decimal.Decimal:
@@ -1,6 +1,8 @@
 import datetime
 import decimal
+import functools
 import hashlib
+import re
 import typing
 
 from ofxtools.Parser import OFXTree
@@ -10,11 +12,16 @@ from ..data_types import Transaction
 from .base import ExtractorBase
 
 
+# The SGML header and the <OFX> root come first, the institution name or FID follows inside
+# the signon block. "<ORG>Credit Human</ORG>" is covered by the bare name
+DETECT_PATTERN = re.compile(r"OFXHEADER:.*?<OFX>.*?(?:<FID>13216</FID>|Credit Human)", re.DOTALL)
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_ofx_datetime(dt_str: str) -> datetime.date:
     """Parse OFX datetime format (YYYYMMDDHHMMSS.sss) to date."""
-    # OFX datetime format is YYYYMMDDHHMMSS.sss, we only need the date part
-    date_part = dt_str[:8]  # YYYYMMDD
-    return datetime.datetime.strptime(date_part, "%Y%m%d").date()
+    # OFX datetime format is YYYYMMDDHHMMSS.sss, we only need the date part at fixed offsets
+    return datetime.date(int(dt_str[:4]), int(dt_str[4:6]), int(dt_str[6:8]))
 
 
 class CreditHumanOFXExtractor(ExtractorBase):
@@ -32,30 +39,26 @@ class CreditHumanOFXExtractor(ExtractorBase):
             if isinstance(content, bytes):
                 content = content.decode('utf-8', errors='ignore')
             
-            # Check for OFX header and Credit Human specific markers
-            return (
-                "OFXHEADER:" in content and
-                "<OFX>" in content and
-                ("<ORG>Credit Human</ORG>" in content or "<FID>13216</FID>" in content or "Credit Human" in content)
-            )
+            # Check for OFX header and Credit Human specific markers in a single scan
+            return DETECT_PATTERN.search(content) is not None
         except Exception:
             return False
 
     def fingerprint(self) -> Fingerprint | None:
         """Generate fingerprint based on first transaction."""
         try:
-            transactions = list(self._parse_transactions())
-            if not transactions:
+            # Only the first transaction is needed, stop consuming the generator after it
+            first_txn = next(self._parse_transactions(), None)
+            if first_txn is None:
                 return None
             
-            # Use first transaction for fingerprint
-            first_txn = transactions[0]
-            
-            # Create hash from first transaction details
-            hash_obj = hashlib.sha256()
-            hash_obj.update(str(first_txn.get('FITID', '')).encode('utf-8'))
-            hash_obj.update(str(first_txn.get('TRNAMT', '')).encode('utf-8'))
-            hash_obj.update(str(first_txn.get('NAME', '')).encode('utf-8'))
+            # Create hash from first transaction details, joined so the digest matches incremental updates
+            hash_obj = hashlib.sha256(
+                "".join(
+                    str(first_txn.get(key, ""))
+                    for key in ("FITID", "TRNAMT", "NAME")
+                ).encode("utf-8")
+            )
             
             return Fingerprint(
                 starting_date=parse_ofx_datetime(first_txn['DTPOSTED']),
@@ -105,9 +108,7 @@ class CreditHumanOFXExtractor(ExtractorBase):
                 # Extract transactions using the correct approach
                 if hasattr(stmt, 'banktranlist') and stmt.banktranlist:
                     # Iterate over banktranlist directly to get transactions
-                    transactions = list(stmt.banktranlist)
-                    
-                    for txn in transactions:
+                    for txn in stmt.banktranlist:
                         # Extract transaction data
                         txn_data = {
                             'TRNTYPE': txn.trntype,
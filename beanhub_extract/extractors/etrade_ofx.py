@@ -1,6 +1,7 @@
 import datetime
 import decimal
 import hashlib
+import re
 import typing
 from io import BytesIO
 
@@ -10,6 +11,12 @@ from ..data_types import Fingerprint
 from ..data_types import Transaction
 from .base import ExtractorBase
 
+# The header, the <OFX> root and the institution marker always appear in this order
+DETECT_PATTERN = re.compile(
+    r"OFXHEADER:.*?<OFX>.*?(?:<ORG>E\*TRADE|<BROKERID>etrade\.com)",
+    re.DOTALL,
+)
+
 
 def parse_ofx_datetime(dt_str: str) -> datetime.date:
     """Parse OFX datetime format (YYYYMMDDHHMMSS.sss) to date."""
@@ -28,16 +35,14 @@ class EtradeOFXExtractor(ExtractorBase):
             self.input_file.seek(0)
             content = self.input_file.read(1000)  # Read first 1000 chars
             self.input_file.seek(0)
-            
-            # Check for OFX header and E*TRADE specific markers
-            return (
-                "OFXHEADER:" in content and
-                "<OFX>" in content and
-                ("<ORG>E*TRADE" in content or "<BROKERID>etrade.com" in content)
-            )
-        except Exception:
+        except (OSError, UnicodeDecodeError, ValueError):
+            return False
+        if not isinstance(content, str):
             return False
 
+        # Check for OFX header and E*TRADE specific markers in a single scan
+        return DETECT_PATTERN.search(content) is not None
+
     def fingerprint(self) -> Fingerprint | None:
         """Generate fingerprint based on first transaction."""
         try:
@@ -49,10 +54,16 @@ class EtradeOFXExtractor(ExtractorBase):
             first_txn = transactions[0]
             
             # Create hash from first transaction details
-            hash_obj = hashlib.sha256()
-            hash_obj.update(str(first_txn.get('FITID', '')).encode('utf-8'))
-            hash_obj.update(str(first_txn.get('TOTAL', '')).encode('utf-8'))
-            hash_obj.update(str(first_txn.get('MEMO', '')).encode('utf-8'))
+            # Hashing the joined value yields the same digest as updating per field
+            hash_obj = hashlib.sha256(
+                "".join(
+                    (
+                        str(first_txn.get('FITID', '')),
+                        str(first_txn.get('TOTAL', '')),
+                        str(first_txn.get('MEMO', '')),
+                    )
+                ).encode('utf-8')
+            )
             
             return Fingerprint(
                 starting_date=parse_ofx_datetime(first_txn['DTTRADE']),
@@ -77,6 +88,20 @@ class EtradeOFXExtractor(ExtractorBase):
         if not hasattr(ofx, 'invstmtmsgsrsv1') or not ofx.invstmtmsgsrsv1:
             return
 
+        # Build securities lookup for CUSIP to ticker/name mapping, the security list is shared by all statements
+        securities_map = {}
+        if hasattr(ofx, 'securities') and ofx.securities:
+            for sec in ofx.securities:
+                if hasattr(sec, 'secinfo'):
+                    secinfo = sec.secinfo
+                    cusip = getattr(secinfo, 'uniqueid', None)
+                    if cusip:
+                        securities_map[cusip] = {
+                            'ticker': getattr(secinfo, 'ticker', ''),
+                            'name': getattr(secinfo, 'secname', ''),
+                            'unitprice': getattr(secinfo, 'unitprice', None)
+                        }
+
         for stmt_wrapper in ofx.invstmtmsgsrsv1:
             stmt = stmt_wrapper.invstmtrs
             currency = stmt.curdef if hasattr(stmt, 'curdef') else 'USD'
@@ -88,20 +113,6 @@ class EtradeOFXExtractor(ExtractorBase):
             if not account_id:
                 raise ValueError("OFX investment statement invacctfrom missing acctid - cannot identify account")
 
-            # Build securities lookup for CUSIP to ticker/name mapping
-            securities_map = {}
-            if hasattr(ofx, 'securities') and ofx.securities:
-                for sec in ofx.securities:
-                    if hasattr(sec, 'secinfo'):
-                        secinfo = sec.secinfo
-                        cusip = getattr(secinfo, 'uniqueid', None)
-                        if cusip:
-                            securities_map[cusip] = {
-                                'ticker': getattr(secinfo, 'ticker', ''),
-                                'name': getattr(secinfo, 'secname', ''),
-                                'unitprice': getattr(secinfo, 'unitprice', None)
-                            }
-
             # Process investment transactions
             if hasattr(stmt, 'invtranlist') and stmt.invtranlist:
                 for txn in stmt.invtranlist:
@@ -160,7 +171,7 @@ class EtradeOFXExtractor(ExtractorBase):
             'FITID': fitid,
             'DTTRADE': dttrade.strftime('%Y%m%d%H%M%S'),
             'MEMO': memo,
-            'TOTAL': str(total) if total is not None else '0',
+            'TOTAL': total if total is not None else decimal.Decimal('0'),
             'UNITS': str(units) if units is not None else None,
             'UNITPRICE': str(unitprice) if unitprice is not None else None,
             'FEES': str(fees) if fees is not None else None,
@@ -181,7 +192,7 @@ class EtradeOFXExtractor(ExtractorBase):
             'FITID': f"BALANCE_{dtasof.strftime('%Y%m%d%H%M%S')}",
             'DTTRADE': dtasof.strftime('%Y%m%d%H%M%S'),
             'MEMO': f"Available Cash Balance as of {dtasof.date()}",
-            'TOTAL': str(invbal.availcash),
+            'TOTAL': invbal.availcash,
             'UNITS': None,
             'UNITPRICE': None,
             'FEES': None,
@@ -211,7 +222,8 @@ class EtradeOFXExtractor(ExtractorBase):
 
             # Parse transaction data
             transaction_date = parse_ofx_datetime(txn_data['DTTRADE'])
-            amount = decimal.Decimal(txn_data['TOTAL'])
+            # ofxtools already parses amounts into Decimal
+            amount = txn_data['TOTAL']
             
             # Extract description and memo
             memo = txn_data.get('MEMO', '').strip()
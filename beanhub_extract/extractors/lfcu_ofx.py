@@ -1,6 +1,7 @@
 import datetime
 import decimal
 import hashlib
+import re
 import typing
 from io import BytesIO
 
@@ -10,6 +11,12 @@ from ..data_types import Fingerprint
 from ..data_types import Transaction
 from .base import ExtractorBase
 
+# The header, the <OFX> root and the institution marker always appear in this order
+DETECT_PATTERN = re.compile(
+    r"OFXHEADER:.*?<OFX>.*?(?:<ORG>Lafayette Federal Credit Union</ORG>|<FID>16710</FID>)",
+    re.DOTALL,
+)
+
 
 def parse_ofx_datetime(dt_str: str) -> datetime.date:
     """Parse OFX datetime format (YYYYMMDDHHMMSS.sss) to date."""
@@ -28,15 +35,13 @@ class LfcuOFXExtractor(ExtractorBase):
             self.input_file.seek(0)
             content = self.input_file.read(1000)  # Read first 1000 chars
             self.input_file.seek(0)
-            
-            # Check for OFX header and LFCU specific markers
-            return (
-                "OFXHEADER:" in content and
-                "<OFX>" in content and
-                ("<ORG>Lafayette Federal Credit Union</ORG>" in content or "<FID>16710</FID>" in content)
-            )
-        except Exception:
+        except (OSError, UnicodeDecodeError, ValueError):
             return False
+        if not isinstance(content, str):
+            return False
+
+        # Check for OFX header and LFCU specific markers in a single scan
+        return DETECT_PATTERN.search(content) is not None
 
     def fingerprint(self) -> Fingerprint | None:
         """Generate fingerprint based on first transaction."""
@@ -49,10 +54,16 @@ class LfcuOFXExtractor(ExtractorBase):
             first_txn = transactions[0]
             
             # Create hash from first transaction details
-            hash_obj = hashlib.sha256()
-            hash_obj.update(str(first_txn.get('FITID', '')).encode('utf-8'))
-            hash_obj.update(str(first_txn.get('TRNAMT', '')).encode('utf-8'))
-            hash_obj.update(str(first_txn.get('NAME', '')).encode('utf-8'))
+            # Hashing the joined value yields the same digest as updating per field
+            hash_obj = hashlib.sha256(
+                "".join(
+                    (
+                        str(first_txn.get('FITID', '')),
+                        str(first_txn.get('TRNAMT', '')),
+                        str(first_txn.get('NAME', '')),
+                    )
+                ).encode('utf-8')
+            )
             
             return Fingerprint(
                 starting_date=parse_ofx_datetime(first_txn['DTPOSTED']),
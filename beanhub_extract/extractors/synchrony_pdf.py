@@ -9,6 +9,15 @@ import pypdf
 from ..data_types import Fingerprint, Transaction
 from .base import ExtractorBase
 
+DETECT_PATTERN = re.compile(r"SYNCHRONY(?:BANK\.COM| BANK| FINANCIAL)", re.IGNORECASE)
+ACCOUNT_NUMBER_PATTERN = re.compile(r"XXXXXXXX(\d+)")
+BALANCE_PATTERN = re.compile(r"Current\s+Balance\s+\$(\d{1,3}(?:,\d{3})*\.\d{2})", re.IGNORECASE)
+# Date + Description + Amount
+TRANSACTION_PATTERN = re.compile(
+    r"((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s+\d{4})\s+(.+?)\s+\$(\d{1,3}(?:,\d{3})*\.\d{2})",
+    re.IGNORECASE,
+)
+
 
 def parse_date(date_str: str) -> datetime.date:
     """Parse date string like 'Aug 14, 2025' to date object"""
@@ -26,8 +35,8 @@ class SynchronyPdfExtractor(ExtractorBase):
     EXTRACTOR_NAME = "synchrony_pdf"
     DEFAULT_IMPORT_ID = "{{ extractor }}:{{ source_account }}:{{ reversed_lineno }}"
 
-    def _extract_pdf_text(self) -> str:
-        """Extract text from PDF using pypdf"""
+    def _extract_pdf_text(self, max_pages: int | None = None) -> str:
+        """Extract text from PDF using pypdf, optionally limited to the first `max_pages` pages"""
         try:
             # Handle both binary and text file objects
             if hasattr(self.input_file, 'mode') and 'b' not in self.input_file.mode:
@@ -37,7 +46,7 @@ class SynchronyPdfExtractor(ExtractorBase):
                     with open(file_path, 'rb') as f:
                         reader = pypdf.PdfReader(f)
                         all_text = ""
-                        for page in reader.pages:
+                        for page in reader.pages[:max_pages]:
                             text = page.extract_text()
                             if text:
                                 all_text += text + "\n"
@@ -50,7 +59,7 @@ class SynchronyPdfExtractor(ExtractorBase):
                 reader = pypdf.PdfReader(self.input_file)
                 all_text = ""
                 
-                for page in reader.pages:
+                for page in reader.pages[:max_pages]:
                     text = page.extract_text()
                     if text:
                         all_text += text + "\n"
@@ -67,34 +76,28 @@ class SynchronyPdfExtractor(ExtractorBase):
             if hasattr(self.input_file, 'mode') and 'b' not in self.input_file.mode:
                 # File is in text mode, need to check file path
                 file_path = getattr(self.input_file, 'name', None)
-                if file_path:
-                    with open(file_path, 'rb') as f:
-                        header = f.read(10)
-                        if not header.startswith(b'%PDF-'):
-                            return False
-                else:
+                if not file_path:
                     return False
+                with open(file_path, 'rb') as f:
+                    header = f.read(10)
             else:
                 # File is in binary mode
                 self.input_file.seek(0)
                 header = self.input_file.read(10)
                 self.input_file.seek(0)
-                if not header.startswith(b'%PDF-'):
-                    return False
+            # In-memory text streams have no mode and hand back str here
+            if not isinstance(header, bytes) or not header.startswith(b'%PDF-'):
+                return False
                 
-            text = self._extract_pdf_text()
+            # The bank name is printed on the first page, no need to extract the whole statement
+            text = self._extract_pdf_text(max_pages=1)
             if not text:
                 return False
                 
             # Check for Synchrony-specific indicators
-            text_upper = text.upper()
-            return (
-                "SYNCHRONYBANK.COM" in text_upper or 
-                "SYNCHRONY BANK" in text_upper or
-                "SYNCHRONY FINANCIAL" in text_upper
-            )
+            return DETECT_PATTERN.search(text) is not None
             
-        except Exception:
+        except (OSError, ValueError, pypdf.errors.PdfReadError):
             return False
 
     def fingerprint(self) -> Fingerprint | None:
@@ -133,17 +136,15 @@ class SynchronyPdfExtractor(ExtractorBase):
         filename = getattr(self.input_file, 'name', None)
         
         # Extract account number
-        account_match = re.search(r'XXXXXXXX(\d+)', text)
+        account_match = ACCOUNT_NUMBER_PATTERN.search(text)
         account_number = account_match.group(1) if account_match else None
         
         # Extract current balance and date
-        balance_pattern = r'Current\s+Balance\s+\$(\d{1,3}(?:,\d{3})*\.\d{2})'
-        balance_match = re.search(balance_pattern, text, re.IGNORECASE)
+        balance_match = BALANCE_PATTERN.search(text)
         current_balance = balance_match.group(1).replace(',', '') if balance_match else None
         
         # Extract transactions: Date + Description + Amount
-        transaction_pattern = r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s+\d{4})\s+(.+?)\s+\$(\d{1,3}(?:,\d{3})*\.\d{2})'
-        transaction_matches = re.findall(transaction_pattern, text, re.IGNORECASE)
+        transaction_matches = TRANSACTION_PATTERN.findall(text)
         
         # Find the most recent transaction date for balance date
         balance_date = None
@@ -7,13 +7,24 @@ import typing
 
 from ..data_types import Fingerprint
 from ..data_types import Transaction
+from ..utils import split_slash_date
 from .base import ExtractorBase
 
 
 def parse_date(date_str: str) -> datetime.date:
     """Parse MM/DD/YYYY date format."""
-    parts = date_str.split("/")
-    return datetime.date(int(parts[2]), int(parts[0]), int(parts[1]))
+    month, day, year = split_slash_date(date_str)
+    return datetime.date(year, month, day)
+
+
+# Column positions, in the same order as WSECUExtractor.ALL_FIELDS
+ACCOUNT_NUMBER_COLUMN = 0
+DATE_COLUMN = 1
+DESCRIPTION_COLUMN = 2
+CATEGORY_COLUMN = 3
+NOTE_COLUMN = 4
+AMOUNT_COLUMN = 5
+BALANCE_COLUMN = 6
 
 
 class WSECUExtractor(ExtractorBase):
@@ -33,8 +44,12 @@ class WSECUExtractor(ExtractorBase):
         """Detect if this is a WSECU CSV file."""
         try:
             self.input_file.seek(0)
-            reader = csv.DictReader(self.input_file)
-            return reader.fieldnames == self.ALL_FIELDS
+            header_line = self.input_file.readline()
+            self.input_file.seek(0)
+            # Compare the raw line first, only quoted headers need the csv parser
+            if header_line.rstrip("\r\n") == ",".join(self.ALL_FIELDS):
+                return True
+            return next(csv.reader([header_line]), None) == self.ALL_FIELDS
         except Exception:
             return False
 
@@ -46,14 +61,10 @@ class WSECUExtractor(ExtractorBase):
             if row is None:
                 return None
             
-            # Get field names for hashing
-            self.input_file.seek(0)
-            reader = csv.DictReader(self.input_file)
-            
-            # Create hash from most recent transaction details
-            hash_obj = hashlib.sha256()
-            for field in reader.fieldnames:
-                hash_obj.update(row[field].encode("utf8"))
+            # Create hash from most recent transaction details, the field names are known from the header
+            hash_obj = hashlib.sha256(
+                "".join(row[field] for field in self.ALL_FIELDS).encode("utf8")
+            )
             
             return Fingerprint(
                 starting_date=parse_date(row["Date"]),
@@ -62,19 +73,31 @@ class WSECUExtractor(ExtractorBase):
         except Exception:
             return None
 
-    def _find_most_recent_transaction(self) -> dict | None:
+    def _read_rows(self) -> typing.Iterator[list[str]] | None:
+        """Return a reader positioned after the header, or None if the header doesn't match."""
+        self.input_file.seek(0)
+        reader = csv.reader(self.input_file)
+        if next(reader, None) != self.ALL_FIELDS:
+            return None
+        # Skip blank lines like csv.DictReader does
+        return (row for row in reader if row)
+
+    def _find_most_recent_transaction(self, rows: list[list[str]] | None = None) -> dict | None:
         """Find the transaction with the most recent date for balance purposes.
         Since WSECU CSV is ordered with most recent transactions first, 
-        we just need the first valid row.
+        we just need the first valid row. Already parsed `rows` can be passed
+        in to avoid reading the file again.
         """
-        self.input_file.seek(0)
-        reader = csv.DictReader(self.input_file)
+        if rows is None:
+            rows = self._read_rows()
+            if rows is None:
+                return None
         
-        for row in reader:
+        for row in rows:
             try:
                 # Validate that this row has a valid date
-                parse_date(row["Date"])
-                return row
+                parse_date(row[DATE_COLUMN])
+                return dict(zip(self.ALL_FIELDS, row))
             except (ValueError, IndexError):
                 continue
         
@@ -108,30 +131,27 @@ class WSECUExtractor(ExtractorBase):
         if hasattr(self.input_file, "name"):
             filename = self.input_file.name
 
-        # Count total rows for reversed_lineno calculation
-        self.input_file.seek(0)
-        row_count_reader = csv.DictReader(self.input_file)
-        row_count = sum(1 for _ in row_count_reader)
+        # Read all rows in a single pass, the row count is needed for reversed_lineno calculation
+        reader = self._read_rows()
+        if reader is None:
+            return
+        rows = list(reader)
+        row_count = len(rows)
 
         # Process transactions
-        self.input_file.seek(0)
-        reader = csv.DictReader(self.input_file)
-        
-        for i, row in enumerate(reader):
+        for i, row in enumerate(rows):
             try:
                 # Parse transaction data - do date parsing first to catch invalid dates early
-                transaction_date = parse_date(row["Date"])
-                amount = decimal.Decimal(row["Amount"])
-                description = row["Description"].strip()
-                category = row["Category"].strip() if row["Category"].strip() else None
-                note = row["Note"].strip() if row["Note"].strip() else None
-                account_number = row["Account number"]
+                transaction_date = parse_date(row[DATE_COLUMN])
+                amount = decimal.Decimal(row[AMOUNT_COLUMN])
+                description = row[DESCRIPTION_COLUMN].strip()
+                category = row[CATEGORY_COLUMN].strip() or None
+                note = row[NOTE_COLUMN].strip() or None
+                account_number = row[ACCOUNT_NUMBER_COLUMN]
                 
-                # Create extra dict for any unused fields
-                extra = {}
-                balance = row["Balance"].strip()
-                if balance:
-                    extra["balance"] = balance
+                # Create extra dict for any unused fields, only when there is something to keep
+                balance = row[BALANCE_COLUMN].strip()
+                extra = {"balance": balance} if balance else None
 
                 yield Transaction(
                     extractor=self.EXTRACTOR_NAME,
@@ -146,13 +166,13 @@ class WSECUExtractor(ExtractorBase):
                     category=category,
                     note=note,
                     source_account=account_number,
-                    extra=extra if extra else None,
+                    extra=extra,
                 )
             except (ValueError, KeyError, decimal.InvalidOperation, IndexError) as e:
                 # Skip malformed transactions but continue processing
                 continue
 
         # Add balance transaction using the most recent date
-        most_recent_row = self._find_most_recent_transaction()
+        most_recent_row = self._find_most_recent_transaction(rows)
         if most_recent_row:
             yield self._create_balance_transaction(most_recent_row, filename)
@@ -1,6 +1,8 @@
 import datetime
 import decimal
 import hashlib
+import logging
+import re
 import typing
 
 from ofxtools.Parser import OFXTree
@@ -9,18 +11,45 @@ from ..data_types import Fingerprint
 from ..data_types import Transaction
 from .base import ExtractorBase
 
+logger = logging.getLogger(__name__)
+
+
+# The header, the <OFX> root and the WSECU routing number always appear in this order,
+# XML format uses OFXHEADER="200", SGML uses OFXHEADER:
+DETECT_PATTERN = re.compile(r'OFXHEADER(?::|=").*?<OFX>.*?<BANKID>325181028', re.DOTALL)
+
+# ofxtools can't parse the " GMT" suffix on these datetime fields
+GMT_SUFFIX_PATTERN = re.compile(r" GMT(</(?:DTSERVER|DTPOSTED|DTASOF|DTSTART|DTEND)>)")
+
+
+class OFXTransaction(typing.NamedTuple):
+    """Raw transaction fields read from the OFX statement."""
+
+    trntype: str
+    date: datetime.date
+    trnamt: str
+    fitid: str
+    name: str | None
+    memo: str | None
+    currency: str
+    account_id: str
+
 
 def parse_ofx_datetime(dt_str: str) -> datetime.date:
     """Parse OFX datetime format (YYYYMMDDHHMMSS.sss) to date."""
-    # OFX datetime format is YYYYMMDDHHMMSS.sss, we only need the date part
-    date_part = dt_str[:8]  # YYYYMMDD
-    return datetime.datetime.strptime(date_part, "%Y%m%d").date()
+    # OFX datetime format is YYYYMMDDHHMMSS.sss, we only need the date part at fixed offsets
+    return datetime.date(int(dt_str[:4]), int(dt_str[4:6]), int(dt_str[6:8]))
 
 
 class WsecuOFXExtractor(ExtractorBase):
     EXTRACTOR_NAME = "wsecu_ofx"
     DEFAULT_IMPORT_ID = "wsecu:{{ source_account }}:{{ transaction_id }}"
 
+    def __init__(self, input_file: typing.TextIO):
+        super().__init__(input_file)
+        # (input_file, converted OFX) from the last successful parse
+        self._ofx_cache = None
+
     def detect(self) -> bool:
         """Detect if this is a WSECU OFX file."""
         try:
@@ -32,65 +61,63 @@ class WsecuOFXExtractor(ExtractorBase):
             if isinstance(content, bytes):
                 content = content.decode('utf-8', errors='ignore')
             
-            # Check for OFX header and WSECU specific markers
-            # XML format uses OFXHEADER="200", SGML uses OFXHEADER:
-            has_ofx_header = "OFXHEADER:" in content or 'OFXHEADER="' in content
-            return (
-                has_ofx_header and
-                "<OFX>" in content and
-                "<BANKID>325181028" in content
-            )
+            # Check for OFX header and WSECU specific markers in a single scan
+            return DETECT_PATTERN.search(content) is not None
         except Exception:
             return False
 
     def fingerprint(self) -> Fingerprint | None:
         """Generate fingerprint based on first transaction."""
         try:
-            transactions = list(self._parse_transactions())
-            if not transactions:
+            # Only the first transaction is needed, stop consuming the generator after it
+            first_txn = next(self._parse_transactions(), None)
+            if first_txn is None:
                 return None
             
-            # Use first transaction for fingerprint
-            first_txn = transactions[0]
-            
             # Create hash from first transaction details
-            hash_obj = hashlib.sha256()
-            hash_obj.update(str(first_txn.get('FITID', '')).encode('utf-8'))
-            hash_obj.update(str(first_txn.get('TRNAMT', '')).encode('utf-8'))
-            hash_obj.update(str(first_txn.get('NAME', '')).encode('utf-8'))
+            # FITID and TRNAMT are always strings, NAME is optional and hashes as "None" when missing
+            hash_obj = hashlib.sha256(
+                "".join((first_txn.fitid, first_txn.trnamt, str(first_txn.name))).encode('utf-8')
+            )
             
             return Fingerprint(
-                starting_date=parse_ofx_datetime(first_txn['DTPOSTED']),
+                starting_date=first_txn.date,
                 first_row_hash=hash_obj.hexdigest(),
             )
         except Exception:
             return None
 
-    def _parse_transactions(self) -> typing.Generator[dict, None, None]:
-        """Parse OFX file and yield transaction dictionaries."""
+    def _load_ofx(self):
+        """Parse the OFX file with ofxtools, reusing the result from an earlier call
+        on the same input file so fingerprint() and __call__ only parse it once.
+        """
+        if self._ofx_cache is not None and self._ofx_cache[0] is self.input_file:
+            return self._ofx_cache[1]
+
+        self.input_file.seek(0)
+        # ofxtools requires binary mode, so always convert text to binary
+        content = self.input_file.read()
         self.input_file.seek(0)
         
+        # Preprocess: Remove " GMT" suffix from datetime fields as ofxtools can't handle it
+        # This handles XML format OFX files that include timezone suffixes
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', errors='ignore')
+        content = GMT_SUFFIX_PATTERN.sub(r"\1", content)
+        
+        from io import BytesIO
+        binary_file = BytesIO(content.encode('utf-8'))
+        
+        parser = OFXTree()
+        parser.parse(binary_file)
+        ofx = parser.convert()
+        self._ofx_cache = (self.input_file, ofx)
+        return ofx
+
+    def _parse_transactions(self) -> typing.Generator[OFXTransaction, None, None]:
+        """Parse OFX file and yield raw transaction tuples."""
         try:
-            # ofxtools requires binary mode, so always convert text to binary
-            content = self.input_file.read()
-            self.input_file.seek(0)
-            
-            # Preprocess: Remove " GMT" suffix from datetime fields as ofxtools can't handle it
-            # This handles XML format OFX files that include timezone suffixes
-            if isinstance(content, bytes):
-                content = content.decode('utf-8', errors='ignore')
-            content = content.replace(' GMT</DTSERVER>', '</DTSERVER>')
-            content = content.replace(' GMT</DTPOSTED>', '</DTPOSTED>')
-            content = content.replace(' GMT</DTASOF>', '</DTASOF>')
-            content = content.replace(' GMT</DTSTART>', '</DTSTART>')
-            content = content.replace(' GMT</DTEND>', '</DTEND>')
-            
-            from io import BytesIO
-            binary_file = BytesIO(content.encode('utf-8'))
-            
-            parser = OFXTree()
-            parser.parse(binary_file)
-            ofx = parser.convert()
+            ofx = self._load_ofx()
             
             if not hasattr(ofx, 'statements') or not ofx.statements:
                 return
@@ -110,50 +137,47 @@ class WsecuOFXExtractor(ExtractorBase):
                 # Get balance information
                 ledger_balance = None
                 ledger_date = None
+                ledger_dtasof = None
                 if hasattr(stmt, 'ledgerbal') and hasattr(stmt.ledgerbal, 'balamt'):
                     ledger_balance = str(stmt.ledgerbal.balamt)
-                    ledger_date = stmt.ledgerbal.dtasof.strftime('%Y%m%d%H%M%S')
+                    ledger_dtasof = stmt.ledgerbal.dtasof
+                    # The formatted timestamp is only needed for the balance FITID
+                    ledger_date = ledger_dtasof.strftime('%Y%m%d%H%M%S')
                 
                 # Extract transactions using the correct approach
                 if hasattr(stmt, 'banktranlist') and stmt.banktranlist:
                     # Iterate over banktranlist directly to get transactions
-                    transactions = list(stmt.banktranlist)
-                    
-                    for txn in transactions:
-                        # Extract transaction data
-                        txn_data = {
-                            'TRNTYPE': txn.trntype,
-                            'DTPOSTED': txn.dtposted.strftime('%Y%m%d%H%M%S'),
-                            'TRNAMT': str(txn.trnamt),
-                            'FITID': txn.fitid,
-                            'NAME': txn.name,
-                        }
-                        
-                        # Add memo if present
-                        if hasattr(txn, 'memo') and txn.memo:
-                            txn_data['MEMO'] = txn.memo
-                        
-                        # Add metadata
-                        txn_data['CURRENCY'] = currency
-                        txn_data['ACCOUNT_ID'] = account_id
-                        
-                        yield txn_data
+                    for txn in stmt.banktranlist:
+                        # Memo is optional in OFX
+                        memo = getattr(txn, 'memo', None) or None
+                        yield OFXTransaction(
+                            trntype=txn.trntype,
+                            # ofxtools already parsed the datetime, no need to format and re-parse it
+                            date=txn.dtposted.date(),
+                            trnamt=str(txn.trnamt),
+                            fitid=txn.fitid,
+                            name=txn.name,
+                            memo=memo,
+                            currency=currency,
+                            account_id=account_id,
+                        )
                     
                     # Yield balance transaction if available
                     if ledger_balance and ledger_date:
-                        yield {
-                            'TRNTYPE': 'BALANCE',
-                            'DTPOSTED': ledger_date,
-                            'TRNAMT': ledger_balance,
-                            'FITID': f"BALANCE_{ledger_date}",
-                            'NAME': f"Balance as of {parse_ofx_datetime(ledger_date)}",
-                            'CURRENCY': currency,
-                            'ACCOUNT_ID': account_id,
-                        }
+                        yield OFXTransaction(
+                            trntype='BALANCE',
+                            date=ledger_dtasof.date(),
+                            trnamt=ledger_balance,
+                            fitid=f"BALANCE_{ledger_date}",
+                            name=f"Balance as of {ledger_dtasof.date()}",
+                            memo=None,
+                            currency=currency,
+                            account_id=account_id,
+                        )
                         
-        except Exception as e:
+        except Exception:
             # Log error but don't crash
-            print(f"Error parsing WSECU OFX file: {e}")
+            logger.warning("Error parsing WSECU OFX file", exc_info=True)
             return
 
     def __call__(self) -> typing.Generator[Transaction, None, None]:
@@ -164,20 +188,12 @@ class WsecuOFXExtractor(ExtractorBase):
             
         for lineno, txn_data in enumerate(self._parse_transactions(), 1):
             try:
-                # Validate required transaction fields
-                if 'DTPOSTED' not in txn_data:
-                    raise ValueError(f"Transaction {lineno} missing DTPOSTED")
-                if 'TRNAMT' not in txn_data:
-                    raise ValueError(f"Transaction {lineno} missing TRNAMT")
-                if 'TRNTYPE' not in txn_data:
-                    raise ValueError(f"Transaction {lineno} missing TRNTYPE")
-                
-                date = parse_ofx_datetime(txn_data['DTPOSTED'])
-                amount = decimal.Decimal(txn_data['TRNAMT'])
-                txn_type = txn_data['TRNTYPE']
-                desc = txn_data.get('NAME', '')
-                note = txn_data.get('MEMO')
-                source_account = txn_data.get('ACCOUNT_ID')
+                date = txn_data.date
+                amount = decimal.Decimal(txn_data.trnamt)
+                txn_type = txn_data.trntype
+                desc = txn_data.name
+                note = txn_data.memo
+                source_account = txn_data.account_id
                 if not source_account:
                     raise ValueError(f"Transaction {lineno} missing ACCOUNT_ID")
                 
@@ -185,18 +201,18 @@ class WsecuOFXExtractor(ExtractorBase):
                     extractor=self.EXTRACTOR_NAME,
                     file=filename,
                     lineno=lineno,
-                    transaction_id=txn_data['FITID'],
+                    transaction_id=txn_data.fitid,
                     date=date,
                     post_date=date,
                     desc=desc,
                     amount=amount,
                     type=txn_type,
                     note=note,
-                    currency=txn_data.get('CURRENCY', 'USD'),
+                    currency=txn_data.currency,
                     source_account=source_account,
                     extra={},
                 )
-            except (ValueError, KeyError) as e:
+            except ValueError as e:
                 # Skip malformed transactions but continue processing
                 continue
 
@@ -1,5 +1,6 @@
 import dataclasses
 import datetime
+import functools
 import pathlib
 
 from .data_types import Transaction
@@ -27,14 +28,24 @@ def strip_txn_base_path(
     """Strip file base path (parent folder) from given transaction"""
     if transaction.file is None:
         return transaction
-    return Transaction(
-        **(
-            dataclasses.asdict(transaction)
-            | dict(file=strip_base_path(base, transaction.file, pure_posix))
-        )
+    # replace() reuses the field values, asdict() would deep-copy all of them
+    return dataclasses.replace(
+        transaction, file=strip_base_path(base, transaction.file, pure_posix)
     )
 
 
 def parse_date(date_str: str) -> datetime.date:
     parts = date_str.split("-")
     return datetime.date(*(map(int, parts)))
+
+
+@functools.lru_cache(maxsize=1024)
+def split_slash_date(date_str: str) -> tuple[int, int, int]:
+    """Split a slash separated date like 08/31/2025 or 31/08/25 into its three numbers,
+    in the order they appear
+    """
+    if len(date_str) in (8, 10) and date_str[2] == "/" and date_str[5] == "/":
+        # Zero-padded dates have the separators at fixed offsets, no need to split
+        return int(date_str[:2]), int(date_str[3:5]), int(date_str[6:])
+    parts = date_str.split("/")
+    return int(parts[0]), int(parts[1]), int(parts[2])
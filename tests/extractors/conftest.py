@@ -1,17 +1,50 @@
+import io
 import pathlib
 import zipfile
 
 import pytest
 
+from beanhub_extract.data_types import Transaction
+from beanhub_extract.extractors.base import ExtractorBase
+from beanhub_extract.utils import strip_txn_base_path
+
 TEST_PACKAGE_FOLDER = pathlib.Path(__file__).parent
 FIXTURE_FOLDER = TEST_PACKAGE_FOLDER / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_folder() -> pathlib.Path:
     return FIXTURE_FOLDER
 
 
+@pytest.fixture(scope="session")
+def fixture_bytes() -> dict[str, bytes]:
+    return {path.name: path.read_bytes() for path in FIXTURE_FOLDER.iterdir()}
+
+
+@pytest.fixture
+def open_fixture(fixture_bytes: dict[str, bytes]):
+    def _open(
+        name: str, mode: str = "rt", encoding: str | None = None
+    ) -> io.BytesIO | io.TextIOWrapper:
+        # Same decoding and newline handling as open(...) without hitting the disk again
+        buffer = io.BytesIO(fixture_bytes[name])
+        if "b" in mode:
+            return buffer
+        return io.TextIOWrapper(buffer, encoding=encoding)
+
+    return _open
+
+
+@pytest.fixture
+def extract_and_strip():
+    def _extract(extractor: ExtractorBase, base: pathlib.Path) -> list[Transaction]:
+        # Strip each transaction as it is yielded instead of building the list twice
+        return [strip_txn_base_path(base, txn) for txn in extractor()]
+
+    return _extract
+
+
 @pytest.fixture
 def zip_file(tmp_path: pathlib.Path) -> pathlib.Path:
     text_file = tmp_path / "hello.txt"
@@ -1,9 +1,11 @@
 import datetime
 import decimal
 import io
+import mmap
 import pytest
 
 from beanhub_extract.extractors.banco_bcr import BancoBcrExtractor
+from beanhub_extract.extractors.banco_bcr import BancoBcrHTMLParser
 
 
 @pytest.fixture
@@ -18,6 +20,20 @@ def banco_bcr_crc_fixture():
     return "tests/extractors/fixtures/banco_bcr_crc.xls"
 
 
+@pytest.fixture(scope="session")
+def banco_bcr_usd_transactions():
+    """Transactions extracted from the USD fixture, parsed once per session."""
+    with open("tests/extractors/fixtures/banco_bcr_usd.xls", "r", encoding="utf-8") as f:
+        return list(BancoBcrExtractor(f)())
+
+
+@pytest.fixture(scope="session")
+def banco_bcr_crc_transactions():
+    """Transactions extracted from the CRC fixture, parsed once per session."""
+    with open("tests/extractors/fixtures/banco_bcr_crc.xls", "r", encoding="utf-8") as f:
+        return list(BancoBcrExtractor(f)())
+
+
 @pytest.fixture
 def invalid_html_content():
     return """<html>
@@ -46,6 +62,16 @@ class TestBancoBcrExtractor:
             extractor = BancoBcrExtractor(f)
             assert extractor.detect() is True
 
+    def test_detect_large_head(self, banco_bcr_usd_fixture):
+        """Test detection when large inline styles push the markers far into the file."""
+        with open(banco_bcr_usd_fixture, 'r', encoding='utf-8') as f:
+            content = f.read()
+        styles = "".join(f"td.col{i} {{ border: 1px solid black; }}\n" for i in range(500))
+        content = content.replace("</style>", styles + "</style>", 1)
+        assert content.index("Banco de Costa Rica") > 8192
+        extractor = BancoBcrExtractor(io.StringIO(content))
+        assert extractor.detect() is True
+
     def test_detect_invalid_html(self, invalid_html_content):
         """Test detection fails for invalid HTML format."""
         input_file = io.StringIO(invalid_html_content)
@@ -72,8 +98,7 @@ class TestBancoBcrExtractor:
             
             assert fingerprint is not None
             assert fingerprint.starting_date == datetime.date(2025, 3, 20)  # First transaction date
-            assert isinstance(fingerprint.first_row_hash, str)
-            assert len(fingerprint.first_row_hash) == 64  # SHA256 hash length
+            assert fingerprint.first_row_hash == "8bb936b3af72429f29815c7e285b45c18c80bfd7dcc1707509857ddc484e1c5c"
 
     def test_fingerprint_valid_crc_fixture(self, banco_bcr_crc_fixture):
         """Test fingerprint generation for valid CRC fixture."""
@@ -83,8 +108,7 @@ class TestBancoBcrExtractor:
             
             assert fingerprint is not None
             assert fingerprint.starting_date == datetime.date(2025, 3, 1)  # First transaction date
-            assert isinstance(fingerprint.first_row_hash, str)
-            assert len(fingerprint.first_row_hash) == 64  # SHA256 hash length
+            assert fingerprint.first_row_hash == "bcf550f9706abf5319d4414afc9d533d5226f0e2daa79a05a700cf2d10e363b1"
 
     def test_fingerprint_empty_html(self, empty_html_content):
         """Test fingerprint returns None for empty HTML."""
@@ -105,6 +129,15 @@ class TestBancoBcrExtractor:
             assert parser.account_type == "Cuenta Ahorros Dólares"
             assert parser.currency == "USD"
 
+    def test_parse_html_once(self, banco_bcr_usd_fixture, mocker):
+        """Test fingerprint and extraction share a single HTML parse."""
+        feed = mocker.spy(BancoBcrHTMLParser, "feed")
+        with open(banco_bcr_usd_fixture, 'r', encoding='utf-8') as f:
+            extractor = BancoBcrExtractor(f)
+            assert extractor.fingerprint() is not None
+            assert len(list(extractor())) == 3
+        assert feed.call_count == 1
+
     def test_parse_crc_account_info(self, banco_bcr_crc_fixture):
         """Test parsing CRC account information from fixture."""
         with open(banco_bcr_crc_fixture, 'r', encoding='utf-8') as f:
@@ -116,81 +149,77 @@ class TestBancoBcrExtractor:
             assert parser.account_type == "Cuenta Ahorros Colones"
             assert parser.currency == "CRC"
 
-    def test_extract_usd_transactions(self, banco_bcr_usd_fixture):
+    def test_extract_usd_transactions(self, banco_bcr_usd_transactions):
         """Test transaction extraction from BCR USD fixture."""
-        with open(banco_bcr_usd_fixture, 'r', encoding='utf-8') as f:
-            extractor = BancoBcrExtractor(f)
-            transactions = list(extractor())
-            
-            # Should have 3 transactions
-            assert len(transactions) == 3
-            
-            # Test first transaction (debit)
-            first_txn = transactions[0]
-            assert first_txn.extractor == "banco_bcr"
-            assert first_txn.lineno == 1
-            assert first_txn.reversed_lineno == 3  # len(transactions) - index = 3 - 0 = 3
-            assert first_txn.date == datetime.date(2025, 3, 20)  # Fecha transacción
-            assert first_txn.post_date == datetime.date(2025, 3, 20)  # Fecha contable
-            assert first_txn.desc == "SERV ADMIN VISA AH"
-            assert first_txn.amount == decimal.Decimal("-1.00")
-            assert first_txn.currency == "USD"
-            assert first_txn.source_account == "CR12345678901234567890"
-            assert first_txn.transaction_id == "1234567:202503200640"
-            assert first_txn.reference == "1234567"
-            
-            # Test second transaction (debit with different post date)
-            second_txn = transactions[1]
-            assert second_txn.date == datetime.date(2025, 3, 24)  # Fecha transacción
-            assert second_txn.post_date == datetime.date(2025, 3, 23)  # Fecha contable
-            assert second_txn.desc == "DB AH QUICK PASS/BILL ELECT"
-            assert second_txn.amount == decimal.Decimal("-16.14")
-            assert second_txn.transaction_id == "7654321:202503241422"
-            assert second_txn.reference == "7654321"
-            
-            # Test third transaction (credit)
-            third_txn = transactions[2]
-            assert third_txn.date == datetime.date(2025, 3, 25)
-            assert third_txn.desc == "DEPOSIT"
-            assert third_txn.amount == decimal.Decimal("500.00")
-            assert third_txn.transaction_id == "9876543:202503250915"
-            assert third_txn.reference == "9876543"
-
-    def test_extract_crc_transactions(self, banco_bcr_crc_fixture):
+        transactions = banco_bcr_usd_transactions
+
+        # Should have 3 transactions
+        assert len(transactions) == 3
+
+        # Test first transaction (debit)
+        first_txn = transactions[0]
+        assert first_txn.extractor == "banco_bcr"
+        assert first_txn.lineno == 1
+        assert first_txn.reversed_lineno == 3  # len(transactions) - index = 3 - 0 = 3
+        assert first_txn.date == datetime.date(2025, 3, 20)  # Fecha transacción
+        assert first_txn.post_date == datetime.date(2025, 3, 20)  # Fecha contable
+        assert first_txn.desc == "SERV ADMIN VISA AH"
+        assert first_txn.amount == decimal.Decimal("-1.00")
+        assert first_txn.currency == "USD"
+        assert first_txn.source_account == "CR12345678901234567890"
+        assert first_txn.transaction_id == "1234567:202503200640"
+        assert first_txn.reference == "1234567"
+
+        # Test second transaction (debit with different post date)
+        second_txn = transactions[1]
+        assert second_txn.date == datetime.date(2025, 3, 24)  # Fecha transacción
+        assert second_txn.post_date == datetime.date(2025, 3, 23)  # Fecha contable
+        assert second_txn.desc == "DB AH QUICK PASS/BILL ELECT"
+        assert second_txn.amount == decimal.Decimal("-16.14")
+        assert second_txn.transaction_id == "7654321:202503241422"
+        assert second_txn.reference == "7654321"
+
+        # Test third transaction (credit)
+        third_txn = transactions[2]
+        assert third_txn.date == datetime.date(2025, 3, 25)
+        assert third_txn.desc == "DEPOSIT"
+        assert third_txn.amount == decimal.Decimal("500.00")
+        assert third_txn.transaction_id == "9876543:202503250915"
+        assert third_txn.reference == "9876543"
+
+    def test_extract_crc_transactions(self, banco_bcr_crc_transactions):
         """Test transaction extraction from BCR CRC fixture."""
-        with open(banco_bcr_crc_fixture, 'r', encoding='utf-8') as f:
-            extractor = BancoBcrExtractor(f)
-            transactions = list(extractor())
-            
-            # Should have 3 transactions
-            assert len(transactions) == 3
-            
-            # Test first transaction (credit)
-            first_txn = transactions[0]
-            assert first_txn.extractor == "banco_bcr"
-            assert first_txn.date == datetime.date(2025, 3, 1)
-            assert first_txn.desc == "TRANSFERENC BANCOBCR/TARJETA"
-            assert first_txn.amount == decimal.Decimal("50000.00")
-            assert first_txn.currency == "CRC"
-            assert first_txn.source_account == "CR98765432109876543210"
-            assert first_txn.transaction_id == "1111111:202503010830"
-            assert first_txn.reference == "1111111"
-            
-            # Test second transaction (debit)
-            second_txn = transactions[1]
-            assert second_txn.date == datetime.date(2025, 3, 15)
-            assert second_txn.desc == "SINPE MOVIL OTRA ENT/Test Payment"
-            assert second_txn.amount == decimal.Decimal("-25000.00")
-            assert second_txn.transaction_id == "2222222:202503151045"
-            assert second_txn.reference == "2222222"
-            
-            # Test third transaction (interest)
-            third_txn = transactions[2]
-            assert third_txn.date == datetime.date(2025, 3, 31)
-            assert third_txn.desc == "INTS GANADOS AHORROS"
-            assert third_txn.amount == decimal.Decimal("1250.00")
-            assert third_txn.transaction_id == "3333333:202503312359"
-            assert third_txn.reference == "3333333"
+        transactions = banco_bcr_crc_transactions
+
+        # Should have 3 transactions
+        assert len(transactions) == 3
+
+        # Test first transaction (credit)
+        first_txn = transactions[0]
+        assert first_txn.extractor == "banco_bcr"
+        assert first_txn.date == datetime.date(2025, 3, 1)
+        assert first_txn.desc == "TRANSFERENC BANCOBCR/TARJETA"
+        assert first_txn.amount == decimal.Decimal("50000.00")
+        assert first_txn.currency == "CRC"
+        assert first_txn.source_account == "CR98765432109876543210"
+        assert first_txn.transaction_id == "1111111:202503010830"
+        assert first_txn.reference == "1111111"
+
+        # Test second transaction (debit)
+        second_txn = transactions[1]
+        assert second_txn.date == datetime.date(2025, 3, 15)
+        assert second_txn.desc == "SINPE MOVIL OTRA ENT/Test Payment"
+        assert second_txn.amount == decimal.Decimal("-25000.00")
+        assert second_txn.transaction_id == "2222222:202503151045"
+        assert second_txn.reference == "2222222"
+
+        # Test third transaction (interest)
+        third_txn = transactions[2]
+        assert third_txn.date == datetime.date(2025, 3, 31)
+        assert third_txn.desc == "INTS GANADOS AHORROS"
+        assert third_txn.amount == decimal.Decimal("1250.00")
+        assert third_txn.transaction_id == "3333333:202503312359"
+        assert third_txn.reference == "3333333"
 
     def test_different_post_and_transaction_dates(self):
         """Test handling of different post and transaction dates."""
@@ -310,23 +339,21 @@ class TestBancoBcrExtractor:
         assert BancoBcrExtractor.EXTRACTOR_NAME == "banco_bcr"
         assert BancoBcrExtractor.DEFAULT_IMPORT_ID == "banco_bcr:{{ source_account }}:{{ transaction_id }}"
 
-    def test_import_id_format_with_transaction_data(self, banco_bcr_usd_fixture):
+    def test_import_id_format_with_transaction_data(self, banco_bcr_usd_transactions):
         """Test that transactions have the correct fields for import ID generation."""
-        with open(banco_bcr_usd_fixture, 'r', encoding='utf-8') as f:
-            extractor = BancoBcrExtractor(f)
-            transactions = list(extractor())
-            
-            first_txn = transactions[0]
-            assert first_txn.source_account == "CR12345678901234567890"
-            assert first_txn.transaction_id == "1234567:202503200640"
-            assert first_txn.reference == "1234567"
-            # The import ID template would resolve to: "banco_bcr:CR12345678901234567890:1234567:202503200640"
-            
-            second_txn = transactions[1]
-            assert second_txn.source_account == "CR12345678901234567890"
-            assert second_txn.transaction_id == "7654321:202503241422"
-            assert second_txn.reference == "7654321"
-            # The import ID template would resolve to: "banco_bcr:CR12345678901234567890:7654321:202503241422"
+        transactions = banco_bcr_usd_transactions
+
+        first_txn = transactions[0]
+        assert first_txn.source_account == "CR12345678901234567890"
+        assert first_txn.transaction_id == "1234567:202503200640"
+        assert first_txn.reference == "1234567"
+        # The import ID template would resolve to: "banco_bcr:CR12345678901234567890:1234567:202503200640"
+
+        second_txn = transactions[1]
+        assert second_txn.source_account == "CR12345678901234567890"
+        assert second_txn.transaction_id == "7654321:202503241422"
+        assert second_txn.reference == "7654321"
+        # The import ID template would resolve to: "banco_bcr:CR12345678901234567890:7654321:202503241422"
 
     def test_account_number_with_html_tags(self):
         """Test account number extraction when split across HTML tags."""
@@ -383,32 +410,21 @@ class TestBancoBcrExtractor:
         txn = transactions[0]
         assert txn.date == datetime.date(2025, 1, 15)  # Should parse correctly despite &nbsp;
 
-    def test_usd_vs_crc_currency_detection(self, banco_bcr_usd_fixture, banco_bcr_crc_fixture):
+    def test_usd_vs_crc_currency_detection(self, banco_bcr_usd_transactions, banco_bcr_crc_transactions):
         """Test that USD and CRC currencies are correctly detected."""
-        # Test USD fixture
-        with open(banco_bcr_usd_fixture, 'r', encoding='utf-8') as f:
-            extractor = BancoBcrExtractor(f)
-            transactions = list(extractor())
-            assert all(txn.currency == "USD" for txn in transactions)
-        
-        # Test CRC fixture
-        with open(banco_bcr_crc_fixture, 'r', encoding='utf-8') as f:
-            extractor = BancoBcrExtractor(f)
-            transactions = list(extractor())
-            assert all(txn.currency == "CRC" for txn in transactions)
+        assert all(txn.currency == "USD" for txn in banco_bcr_usd_transactions)
+        assert all(txn.currency == "CRC" for txn in banco_bcr_crc_transactions)
 
     def test_fixture_files_exist_and_are_valid(self, banco_bcr_usd_fixture, banco_bcr_crc_fixture):
         """Test that fixture files exist and contain valid BCR data."""
-        # Test USD fixture exists and is valid
-        with open(banco_bcr_usd_fixture, 'r', encoding='utf-8') as f:
-            content = f.read()
-            assert "Banco de Costa Rica" in content
-            assert "Cuenta Ahorros Dólares" in content
-            assert "CR12345678901234567890" in content
+        # Test USD fixture exists and is valid, search the mapped bytes without reading them into a str
+        with open(banco_bcr_usd_fixture, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            assert content.find(b"Banco de Costa Rica") != -1
+            assert content.find("Cuenta Ahorros Dólares".encode("utf-8")) != -1
+            assert content.find(b"CR12345678901234567890") != -1
         
         # Test CRC fixture exists and is valid
-        with open(banco_bcr_crc_fixture, 'r', encoding='utf-8') as f:
-            content = f.read()
-            assert "Banco de Costa Rica" in content
-            assert "Cuenta Ahorros Colones" in content
-            assert "CR98765432109876543210" in content
+        with open(banco_bcr_crc_fixture, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            assert content.find(b"Banco de Costa Rica") != -1
+            assert content.find(b"Cuenta Ahorros Colones") != -1
+            assert content.find(b"CR98765432109876543210") != -1
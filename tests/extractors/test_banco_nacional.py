@@ -4,6 +4,7 @@ import io
 import pytest
 
 from beanhub_extract.extractors.banco_nacional import BancoNacionalExtractor
+from beanhub_extract.extractors.banco_nacional import parse_date
 
 
 @pytest.fixture
@@ -67,8 +68,7 @@ class TestBancoNacionalExtractor:
             
             assert fingerprint is not None
             assert fingerprint.starting_date == datetime.date(2024, 12, 15)  # First transaction date
-            assert isinstance(fingerprint.first_row_hash, str)
-            assert len(fingerprint.first_row_hash) == 64  # SHA256 hash length
+            assert fingerprint.first_row_hash == "ab2f4720d9d1eadd4179d2606f452a2b3fbdef8f41cde75dde2a4cace0154b07"
 
     def test_fingerprint_empty_csv(self, empty_csv_content):
         """Test fingerprint returns None for empty CSV."""
@@ -224,6 +224,14 @@ class TestBancoNacionalExtractor:
         assert transactions[0].date == datetime.date(2024, 12, 15)
         assert transactions[1].date == datetime.date(2025, 1, 1)
 
+    def test_parse_date_formats(self):
+        """Test parse_date with zero-padded, non-padded and space-padded dates."""
+        assert parse_date("15/12/2024") == datetime.date(2024, 12, 15)
+        assert parse_date("1/2/2025") == datetime.date(2025, 2, 1)
+        assert parse_date(" 01/01/2025 ") == datetime.date(2025, 1, 1)
+        with pytest.raises((ValueError, IndexError)):
+            parse_date("2024-12-15")
+
     def test_fixture_file_exists_and_is_valid(self, banco_nacional_fixture):
         """Test that fixture file exists and contains valid Banco Nacional data."""
         with open(banco_nacional_fixture, 'r', encoding='utf-8') as f:
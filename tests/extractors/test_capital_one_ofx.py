@@ -1,6 +1,5 @@
 import datetime
 import decimal
-import functools
 import pathlib
 
 import pytest
@@ -24,114 +23,107 @@ def test_parse_ofx_datetime(dt_str: str, expected: datetime.date):
     assert parse_ofx_datetime(dt_str) == expected
 
 
-@pytest.mark.parametrize(
-    "input_file, expected",
-    [
-        (
-            "capital_one.ofx",
-            [
-                Transaction(
-                    extractor="capital_one_ofx",
-                    file="capital_one.ofx",
-                    lineno=1,
-                    transaction_id="202403151152001",
-                    date=datetime.date(2024, 3, 14),
-                    post_date=datetime.date(2024, 3, 15),
-                    desc="COFFEE SHOP DOWNTOWN",
-                    amount=decimal.Decimal("-25.99"),
-                    type="DEBIT",
-                    note=None,
-                    currency="USD",
-                    source_account="1234",
-                    last_four_digits="1234",
-                    extra={},
-                ),
-                Transaction(
-                    extractor="capital_one_ofx",
-                    file="capital_one.ofx",
-                    lineno=2,
-                    transaction_id="202403141202002",
-                    date=datetime.date(2024, 3, 14),
-                    post_date=datetime.date(2024, 3, 14),
-                    desc="GROCERY STORE",
-                    amount=decimal.Decimal("-12.50"),
-                    type="DEBIT",
-                    note=None,
-                    currency="USD",
-                    source_account="1234",
-                    last_four_digits="5678",
-                    extra={},
-                ),
-                Transaction(
-                    extractor="capital_one_ofx",
-                    file="capital_one.ofx",
-                    lineno=3,
-                    transaction_id="202403122149004",
-                    date=datetime.date(2024, 3, 12),
-                    post_date=datetime.date(2024, 3, 12),
-                    desc="CAPITAL ONE AUTOPAY PYMT",
-                    amount=decimal.Decimal("500.00"),
-                    type="CREDIT",
-                    note=None,
-                    currency="USD",
-                    source_account="1234",
-                    last_four_digits="1234",
-                    extra={},
-                ),
-                Transaction(
-                    extractor="capital_one_ofx",
-                    file="capital_one.ofx",
-                    lineno=4,
-                    transaction_id="BALANCE_20240316174441",
-                    date=datetime.date(2024, 3, 16),
-                    post_date=datetime.date(2024, 3, 16),
-                    desc="Balance as of 2024-03-16",
-                    amount=decimal.Decimal("-234.56"),
-                    type="BALANCE",
-                    note=None,
-                    currency="USD",
-                    source_account="1234",
-                    last_four_digits="1234",
-                    extra={},
-                ),
-            ],
+EXPECTED_CAPITAL_ONE_OFX = {
+    "capital_one.ofx": [
+        Transaction(
+            extractor="capital_one_ofx",
+            file="capital_one.ofx",
+            lineno=1,
+            transaction_id="202403151152001",
+            date=datetime.date(2024, 3, 14),
+            post_date=datetime.date(2024, 3, 15),
+            desc="COFFEE SHOP DOWNTOWN",
+            amount=decimal.Decimal("-25.99"),
+            type="DEBIT",
+            note=None,
+            currency="USD",
+            source_account="1234",
+            last_four_digits="1234",
+            extra={},
+        ),
+        Transaction(
+            extractor="capital_one_ofx",
+            file="capital_one.ofx",
+            lineno=2,
+            transaction_id="202403141202002",
+            date=datetime.date(2024, 3, 14),
+            post_date=datetime.date(2024, 3, 14),
+            desc="GROCERY STORE",
+            amount=decimal.Decimal("-12.50"),
+            type="DEBIT",
+            note=None,
+            currency="USD",
+            source_account="1234",
+            last_four_digits="5678",
+            extra={},
+        ),
+        Transaction(
+            extractor="capital_one_ofx",
+            file="capital_one.ofx",
+            lineno=3,
+            transaction_id="202403122149004",
+            date=datetime.date(2024, 3, 12),
+            post_date=datetime.date(2024, 3, 12),
+            desc="CAPITAL ONE AUTOPAY PYMT",
+            amount=decimal.Decimal("500.00"),
+            type="CREDIT",
+            note=None,
+            currency="USD",
+            source_account="1234",
+            last_four_digits="1234",
+            extra={},
+        ),
+        Transaction(
+            extractor="capital_one_ofx",
+            file="capital_one.ofx",
+            lineno=4,
+            transaction_id="BALANCE_20240316174441",
+            date=datetime.date(2024, 3, 16),
+            post_date=datetime.date(2024, 3, 16),
+            desc="Balance as of 2024-03-16",
+            amount=decimal.Decimal("-234.56"),
+            type="BALANCE",
+            note=None,
+            currency="USD",
+            source_account="1234",
+            last_four_digits="1234",
+            extra={},
         ),
     ],
-)
-def test_capital_one_ofx_extractor(
-    input_file: str, expected: list[Transaction], fixtures_folder: pathlib.Path
-):
-    input_file_path = fixtures_folder / input_file
-    with input_file_path.open("rt") as fo:
-        extractor = CapitalOneOFXExtractor(fo)
-        result = list(extractor())
-        result = [strip_txn_base_path(fixtures_folder, txn) for txn in result]
-        assert result == expected
+}
 
+EXPECTED_CAPITAL_ONE_OFX_FINGERPRINTS = {
+    "capital_one.ofx": Fingerprint(
+        starting_date=datetime.date(2024, 3, 15),
+        first_row_hash="2426647c95b2de8b0108b8fc9a6cfff446f2698f949d90680b5392b4f00b5fb3",
+    ),
+}
 
-@pytest.mark.parametrize(
-    "input_file, expected",
-    [
-        (
-            "capital_one.ofx",
-            Fingerprint(
-                starting_date=datetime.date(2024, 3, 15),
-                first_row_hash="a8b9c0d1e2f3456789abcdef01234567890abcdef01234567890abcdef012345",
-            ),
-        ),
-    ],
-)
-def test_capital_one_ofx_fingerprint(
-    input_file: str, expected: Fingerprint, fixtures_folder: pathlib.Path
-):
-    input_file_path = fixtures_folder / input_file
-    with input_file_path.open("rt") as fo:
+
+@pytest.fixture(scope="module", params=list(EXPECTED_CAPITAL_ONE_OFX))
+def capital_one_ofx_parsed(
+    request: pytest.FixtureRequest, fixtures_folder: pathlib.Path
+) -> tuple[str, list[Transaction], Fingerprint | None]:
+    """Fixture file name, transactions and fingerprint from a single extractor,
+    parsed once per module for each file."""
+    with (fixtures_folder / request.param).open("rt") as fo:
         extractor = CapitalOneOFXExtractor(fo)
-        result = extractor.fingerprint()
-        # We can't predict the exact hash, so just check the date and that hash exists
-        assert result is not None
-        assert result.starting_date == expected.starting_date
-        assert len(result.first_row_hash) == 64  # SHA256 hash length
+        # Fingerprint first so it runs on the fresh handle
+        fingerprint = extractor.fingerprint()
+        transactions = [
+            strip_txn_base_path(fixtures_folder, txn) for txn in extractor()
+        ]
+        return request.param, transactions, fingerprint
+
+
+def test_capital_one_ofx_extractor(capital_one_ofx_parsed):
+    input_file, result, _ = capital_one_ofx_parsed
+    assert result == EXPECTED_CAPITAL_ONE_OFX[input_file]
+
+
+def test_capital_one_ofx_fingerprint(capital_one_ofx_parsed):
+    input_file, _, result = capital_one_ofx_parsed
+    assert result == EXPECTED_CAPITAL_ONE_OFX_FINGERPRINTS[input_file]
 
 
 @pytest.mark.parametrize(
@@ -143,10 +135,9 @@ def test_capital_one_ofx_fingerprint(
     ],
 )
 def test_capital_one_ofx_detect(
-    input_file: str, expected: bool, fixtures_folder: pathlib.Path
+    input_file: str, expected: bool, open_fixture
 ):
-    input_file_path = fixtures_folder / input_file
-    with input_file_path.open("rt") as fo:
+    with open_fixture(input_file) as fo:
         extractor = CapitalOneOFXExtractor(fo)
         result = extractor.detect()
         assert result == expected
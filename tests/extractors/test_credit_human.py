@@ -20,6 +20,8 @@ from beanhub_extract.utils import strip_txn_base_path
         ("06/11/25", datetime.date(2025, 6, 11)),
         ("12/31/24", datetime.date(2024, 12, 31)),
         ("01/01/26", datetime.date(2026, 1, 1)),
+        ("1/5/26", datetime.date(2026, 1, 5)),
+        ("12/31/99", datetime.date(1999, 12, 31)),
     ],
 )
 def test_parse_date(date_str: str, expected: datetime.date):
@@ -107,8 +109,7 @@ def test_credit_human_extractor(
     input_file_path = fixtures_folder / input_file
     with input_file_path.open("rt") as fo:
         extractor = CreditHumanExtractor(fo)
-        result = list(extractor())
-        result = [strip_txn_base_path(fixtures_folder, txn) for txn in result]
+        result = [strip_txn_base_path(fixtures_folder, txn) for txn in extractor()]
         assert result == expected
 
 
@@ -125,10 +126,9 @@ def test_credit_human_extractor(
     ],
 )
 def test_credit_human_fingerprint(
-    input_file: str, expected: Fingerprint, fixtures_folder: pathlib.Path
+    input_file: str, expected: Fingerprint, open_fixture
 ):
-    input_file_path = fixtures_folder / input_file
-    with input_file_path.open("rt") as fo:
+    with open_fixture(input_file) as fo:
         extractor = CreditHumanExtractor(fo)
         result = extractor.fingerprint()
         # We can't predict the exact hash, so just check the date and that hash exists
@@ -147,10 +147,9 @@ def test_credit_human_fingerprint(
     ],
 )
 def test_credit_human_detect(
-    input_file: str, expected: bool, fixtures_folder: pathlib.Path
+    input_file: str, expected: bool, open_fixture
 ):
-    input_file_path = fixtures_folder / input_file
-    with input_file_path.open("rt") as fo:
+    with open_fixture(input_file) as fo:
         extractor = CreditHumanExtractor(fo)
         result = extractor.detect()
         assert result == expected
@@ -99,8 +99,7 @@ def test_credit_human_ofx_extractor(
     input_file_path = fixtures_folder / input_file
     with input_file_path.open("rt") as fo:
         extractor = CreditHumanOFXExtractor(fo)
-        result = list(extractor())
-        result = [strip_txn_base_path(fixtures_folder, txn) for txn in result]
+        result = [strip_txn_base_path(fixtures_folder, txn) for txn in extractor()]
         assert result == expected
 
 
@@ -111,21 +110,18 @@ def test_credit_human_ofx_extractor(
             "credit_human.ofx",
             Fingerprint(
                 starting_date=datetime.date(2025, 10, 11),
-                first_row_hash="a1b2c3d4e5f6789012345678901234567890abcdef01234567890abcdef012345",
+                first_row_hash="9ad4cb5827df0beb24487d02f4c8bf3de4f09a33131bd1280e0336ecebe2084a",
             ),
         ),
     ],
 )
 def test_credit_human_ofx_fingerprint(
-    input_file: str, expected: Fingerprint, fixtures_folder: pathlib.Path
+    input_file: str, expected: Fingerprint, open_fixture
 ):
-    input_file_path = fixtures_folder / input_file
-    with input_file_path.open("rt") as fo:
+    with open_fixture(input_file) as fo:
         extractor = CreditHumanOFXExtractor(fo)
         result = extractor.fingerprint()
-        assert result is not None
-        assert result.starting_date == expected.starting_date
-        assert len(result.first_row_hash) == 64  # SHA256 hash length
+        assert result == expected
 
 
 @pytest.mark.parametrize(
@@ -141,10 +137,9 @@ def test_credit_human_ofx_fingerprint(
     ],
 )
 def test_credit_human_ofx_detect(
-    input_file: str, expected: bool, fixtures_folder: pathlib.Path
+    input_file: str, expected: bool, open_fixture
 ):
-    input_file_path = fixtures_folder / input_file
-    with input_file_path.open("rt") as fo:
+    with open_fixture(input_file) as fo:
         extractor = CreditHumanOFXExtractor(fo)
         result = extractor.detect()
         assert result == expected
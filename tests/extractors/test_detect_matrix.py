@@ -0,0 +1,40 @@
+import pytest
+
+from beanhub_extract.extractors.docfcu_ofx import DocfcuOFXExtractor
+from beanhub_extract.extractors.etrade_ofx import EtradeOFXExtractor
+from beanhub_extract.extractors.lfcu_ofx import LfcuOFXExtractor
+from beanhub_extract.extractors.ussfcu_ofx import UssfcuOFXExtractor
+from beanhub_extract.extractors.wsecu_ofx import WsecuOFXExtractor
+
+# Fixtures from other institutions and formats that no OFX extractor here should claim
+NEGATIVE_OFX = (
+    "ussfcu.ofx",
+    "ally_bank.qfx",
+    "capital_one.ofx",
+    "lfcu.ofx",
+    "credit_human.ofx",
+    "docfcu.ofx",
+    "chase_credit_card.csv",
+    "csv.csv",
+)
+
+
+def detect_params(extractor_cls, positive: str) -> list[tuple]:
+    return [(extractor_cls, positive, True)] + [
+        (extractor_cls, name, False) for name in NEGATIVE_OFX if name != positive
+    ]
+
+
+DETECT_CASES = [
+    *detect_params(DocfcuOFXExtractor, "docfcu.ofx"),
+    *detect_params(EtradeOFXExtractor, "etrade.qfx"),
+    *detect_params(LfcuOFXExtractor, "lfcu.ofx"),
+    *detect_params(UssfcuOFXExtractor, "ussfcu.ofx"),
+    *detect_params(WsecuOFXExtractor, "wsecu.ofx"),
+]
+
+
+@pytest.mark.parametrize("extractor_cls, input_file, expected", DETECT_CASES)
+def test_detect_matrix(extractor_cls, input_file: str, expected: bool, open_fixture):
+    with open_fixture(input_file) as fo:
+        assert extractor_cls(fo).detect() == expected
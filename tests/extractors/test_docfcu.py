@@ -42,167 +42,175 @@ def test_parse_currency_amount(amount_str: str, expected: decimal.Decimal):
     assert parse_currency_amount(amount_str) == expected
 
 
+@pytest.fixture(scope="module")
+def docfcu_result(fixtures_folder: pathlib.Path) -> list[Transaction]:
+    """Transactions extracted from docfcu.csv, parsed once per module."""
+    with open(fixtures_folder / "docfcu.csv", encoding="utf-8") as f:
+        return [
+            strip_txn_base_path(fixtures_folder, txn) for txn in DocfcuExtractor(f)()
+        ]
+
+
+DOCFCU_BALANCE_TXN = Transaction(
+    extractor="docfcu",
+    file="docfcu.csv",
+    lineno=0,
+    transaction_id="BALANCE_20250831_XXXXXXX123",
+    date=datetime.date(2025, 9, 1),  # Day after most recent transaction
+    post_date=datetime.date(2025, 9, 1),
+    desc="Balance as of 2025-08-31",
+    amount=decimal.Decimal("10000.00"),
+    currency="USD",
+    type="BALANCE",
+    source_account="XXXXXXX123",
+    extra=None,
+)
+
+
+EXPECTED_DOCFCU = [
+    Transaction(
+        extractor="docfcu",
+        file="docfcu.csv",
+        lineno=6,
+        transaction_id="TXN20250831000000[-5:EST]*123.45*521**Deposit Dividend 4.690%",
+        date=datetime.date(2025, 8, 31),
+        post_date=datetime.date(2025, 8, 31),
+                                desc="Deposit Dividend 4.690% - APY Earned XXXXXX08/01/25 to 08/31/25",
+        amount=decimal.Decimal("123.45"),
+        currency="USD",
+        source_account="XXXXXXX123",
+        extra={
+            "balance": "10000.00",
+            "fees": "0.00",
+            "principal": "123.45",
+            "interest": "0.00",
+            "memo": "APY Earned XXXXXX08/01/25 to 08/31/25",
+        },
+    ),
+    Transaction(
+        extractor="docfcu",
+        file="docfcu.csv",
+        lineno=8,
+        transaction_id="TXN20250731000000[-5:EST]*98.76*521**Deposit Dividend 4.690%",
+        date=datetime.date(2025, 7, 31),
+        post_date=datetime.date(2025, 7, 31),
+                                desc="Deposit Dividend 4.690% - APY Earned XXXXXX07/01/25 to 07/31/25",
+        amount=decimal.Decimal("98.76"),
+        currency="USD",
+        source_account="XXXXXXX123",
+        extra={
+            "balance": "9876.55",
+            "fees": "0.00",
+            "principal": "98.76",
+            "interest": "0.00",
+            "memo": "APY Earned XXXXXX07/01/25 to 07/31/25",
+        },
+    ),
+    Transaction(
+        extractor="docfcu",
+        file="docfcu.csv",
+        lineno=10,
+        transaction_id="TXN20250630000000[-5:EST]*87.65*521**Deposit Dividend 4.690%",
+        date=datetime.date(2025, 6, 30),
+        post_date=datetime.date(2025, 6, 30),
+                                desc="Deposit Dividend 4.690% - APY Earned XXXXXX06/01/25 to 06/30/25",
+        amount=decimal.Decimal("87.65"),
+        currency="USD",
+        source_account="XXXXXXX123",
+        extra={
+            "balance": "9777.79",
+            "fees": "0.00",
+            "principal": "87.65",
+            "interest": "0.00",
+            "memo": "APY Earned XXXXXX06/01/25 to 06/30/25",
+        },
+    ),
+    DOCFCU_BALANCE_TXN,
+]
+
+
 @pytest.mark.parametrize(
     "input_file, expected",
     [
-        (
-            "docfcu.csv",
-            [
-                Transaction(
-                    extractor="docfcu",
-                    file="docfcu.csv",
-                    lineno=6,
-                    transaction_id="TXN20250831000000[-5:EST]*123.45*521**Deposit Dividend 4.690%",
-                    date=datetime.date(2025, 8, 31),
-                    post_date=datetime.date(2025, 8, 31),
-                                            desc="Deposit Dividend 4.690% - APY Earned XXXXXX08/01/25 to 08/31/25",
-                    amount=decimal.Decimal("123.45"),
-                    currency="USD",
-                    source_account="XXXXXXX123",
-                    extra={
-                        "balance": "10000.00",
-                        "fees": "0.00",
-                        "principal": "123.45",
-                        "interest": "0.00",
-                        "memo": "APY Earned XXXXXX08/01/25 to 08/31/25",
-                    },
-                ),
-                Transaction(
-                    extractor="docfcu",
-                    file="docfcu.csv",
-                    lineno=8,
-                    transaction_id="TXN20250731000000[-5:EST]*98.76*521**Deposit Dividend 4.690%",
-                    date=datetime.date(2025, 7, 31),
-                    post_date=datetime.date(2025, 7, 31),
-                                            desc="Deposit Dividend 4.690% - APY Earned XXXXXX07/01/25 to 07/31/25",
-                    amount=decimal.Decimal("98.76"),
-                    currency="USD",
-                    source_account="XXXXXXX123",
-                    extra={
-                        "balance": "9876.55",
-                        "fees": "0.00",
-                        "principal": "98.76",
-                        "interest": "0.00",
-                        "memo": "APY Earned XXXXXX07/01/25 to 07/31/25",
-                    },
-                ),
-                Transaction(
-                    extractor="docfcu",
-                    file="docfcu.csv",
-                    lineno=10,
-                    transaction_id="TXN20250630000000[-5:EST]*87.65*521**Deposit Dividend 4.690%",
-                    date=datetime.date(2025, 6, 30),
-                    post_date=datetime.date(2025, 6, 30),
-                                            desc="Deposit Dividend 4.690% - APY Earned XXXXXX06/01/25 to 06/30/25",
-                    amount=decimal.Decimal("87.65"),
-                    currency="USD",
-                    source_account="XXXXXXX123",
-                    extra={
-                        "balance": "9777.79",
-                        "fees": "0.00",
-                        "principal": "87.65",
-                        "interest": "0.00",
-                        "memo": "APY Earned XXXXXX06/01/25 to 06/30/25",
-                    },
-                ),
-                Transaction(
-                    extractor="docfcu",
-                    file="docfcu.csv",
-                    lineno=0,
-                    transaction_id="BALANCE_20250831_XXXXXXX123",
-                    date=datetime.date(2025, 9, 1),  # Day after most recent transaction
-                    post_date=datetime.date(2025, 9, 1),
-                    desc="Balance as of 2025-08-31",
-                    amount=decimal.Decimal("10000.00"),
-                    currency="USD",
-                    type="BALANCE",
-                    source_account="XXXXXXX123",
-                    extra=None,
-                ),
-            ],
-        ),
+        ("docfcu.csv", EXPECTED_DOCFCU),
     ],
 )
-def test_extract(input_file: str, expected: list[Transaction]):
+def test_extract(input_file: str, expected: list[Transaction], extract_and_strip):
     fixture_path = pathlib.Path(__file__).parent / "fixtures" / input_file
     with open(fixture_path, encoding="utf-8") as f:
         extractor = DocfcuExtractor(f)
-        result = list(extractor())
-        result = [strip_txn_base_path(fixture_path.parent, txn) for txn in result]
+        result = extract_and_strip(extractor, fixture_path.parent)
         assert result == expected
 
 
-def test_detect():
-    fixture_path = pathlib.Path(__file__).parent / "fixtures" / "docfcu.csv"
-    with open(fixture_path, encoding="utf-8") as f:
+def test_detect(open_fixture):
+    with open_fixture("docfcu.csv", encoding="utf-8") as f:
         extractor = DocfcuExtractor(f)
         assert extractor.detect() is True
 
 
-def test_fingerprint():
-    fixture_path = pathlib.Path(__file__).parent / "fixtures" / "docfcu.csv"
-    with open(fixture_path, encoding="utf-8") as f:
+def test_fingerprint(open_fixture):
+    with open_fixture("docfcu.csv", encoding="utf-8") as f:
         extractor = DocfcuExtractor(f)
         result = extractor.fingerprint()
         expected = Fingerprint(
             starting_date=datetime.date(2025, 8, 31),
-            first_row_hash="a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8",
+            first_row_hash="2db199f37ba317c25d7d6241e7ddbc5484370ad5936482a6c15f7e4abcd667a3",
         )
-        assert result.starting_date == expected.starting_date
-        # Hash will be different but should be consistent
-        assert len(result.first_row_hash) == 64  # SHA256 hash length
+        assert result == expected
 
 
-def test_extract_account_info():
-    fixture_path = pathlib.Path(__file__).parent / "fixtures" / "docfcu.csv"
-    with open(fixture_path, encoding="utf-8") as f:
+def test_extract_account_info(open_fixture):
+    with open_fixture("docfcu.csv", encoding="utf-8") as f:
         extractor = DocfcuExtractor(f)
         account_name, account_number = extractor._extract_account_info()
         assert account_name == "60 MONTH CERTIFICATE"
         assert account_number == "XXXXXXX123"
 
 
-def test_comment_lines_filtered():
+def test_comment_lines_filtered(docfcu_result: list[Transaction]):
     """Test that COMMENT lines are filtered out and not included in transactions."""
-    fixture_path = pathlib.Path(__file__).parent / "fixtures" / "docfcu.csv"
-    with open(fixture_path, encoding="utf-8") as f:
-        extractor = DocfcuExtractor(f)
-        result = list(extractor())
-        
-        # Should have 4 transactions: 3 actual + 1 balance, not 6 (which would include comments)
-        assert len(result) == 4
-        
-        # Verify none of the transactions have "COMMENT" in the description
-        for txn in result:
-            assert txn.desc != "COMMENT"
-            assert "COMMENT" not in txn.transaction_id
-        
-        # Verify we have the expected transaction IDs (not the comment ones)
-        transaction_ids = [txn.transaction_id for txn in result]
-        expected_ids = [
-            "TXN20250831000000[-5:EST]*123.45*521**Deposit Dividend 4.690%",
-            "TXN20250731000000[-5:EST]*98.76*521**Deposit Dividend 4.690%", 
-            "TXN20250630000000[-5:EST]*87.65*521**Deposit Dividend 4.690%",
-            "BALANCE_20250831_XXXXXXX123"
-        ]
-        assert transaction_ids == expected_ids
-
-
-def test_balance_transaction_created():
+    result = docfcu_result
+
+    # Should have 4 transactions: 3 actual + 1 balance, not 6 (which would include comments)
+    assert len(result) == 4
+    
+    # Verify none of the transactions come from COMMENT lines, collecting the IDs in the same pass
+    transaction_ids = []
+    for txn in result:
+        assert txn.desc != "COMMENT"
+        assert "COMMENT" not in txn.transaction_id
+        transaction_ids.append(txn.transaction_id)
+    
+    # Verify we have the expected transaction IDs (not the comment ones)
+    expected_ids = [
+        "TXN20250831000000[-5:EST]*123.45*521**Deposit Dividend 4.690%",
+        "TXN20250731000000[-5:EST]*98.76*521**Deposit Dividend 4.690%", 
+        "TXN20250630000000[-5:EST]*87.65*521**Deposit Dividend 4.690%",
+        "BALANCE_20250831_XXXXXXX123"
+    ]
+    assert transaction_ids == expected_ids
+
+
+def test_balance_transaction_created(docfcu_result: list[Transaction]):
     """Test that a balance transaction is created from the most recent transaction."""
-    fixture_path = pathlib.Path(__file__).parent / "fixtures" / "docfcu.csv"
-    with open(fixture_path, encoding="utf-8") as f:
-        extractor = DocfcuExtractor(f)
-        result = list(extractor())
-        
-        # Find the balance transaction
-        balance_txns = [txn for txn in result if txn.type == "BALANCE"]
-        assert len(balance_txns) == 1
-        
-        balance_txn = balance_txns[0]
-        assert balance_txn.transaction_id == "BALANCE_20250831_XXXXXXX123"
-        assert balance_txn.date == datetime.date(2025, 9, 1)  # Day after most recent
-        assert balance_txn.amount == decimal.Decimal("10000.00")  # Balance from most recent
-        assert balance_txn.currency == "USD"
-        assert balance_txn.source_account == "XXXXXXX123"
-        assert balance_txn.desc == "Balance as of 2025-08-31"
+    result = docfcu_result
+
+    # Find the balance transaction
+    balance_txns = [txn for txn in result if txn.type == "BALANCE"]
+    assert len(balance_txns) == 1
+
+    balance_txn = balance_txns[0]
+    most_recent = max(
+        (txn for txn in result if txn.type != "BALANCE"), key=lambda txn: txn.date
+    )
+    assert balance_txn.date == most_recent.date + datetime.timedelta(days=1)
+    assert balance_txn.post_date == balance_txn.date
+    assert balance_txn.amount == decimal.Decimal(most_recent.extra["balance"])
+    assert (
+        balance_txn.transaction_id
+        == f"BALANCE_{most_recent.date:%Y%m%d}_{most_recent.source_account}"
+    )
+    assert balance_txn.desc == f"Balance as of {most_recent.date.isoformat()}"
+    assert balance_txn.currency == most_recent.currency
+    assert balance_txn.source_account == most_recent.source_account
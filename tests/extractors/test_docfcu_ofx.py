@@ -8,7 +8,6 @@ from beanhub_extract.data_types import Fingerprint
 from beanhub_extract.data_types import Transaction
 from beanhub_extract.extractors.docfcu_ofx import DocfcuOFXExtractor
 from beanhub_extract.extractors.docfcu_ofx import parse_ofx_datetime
-from beanhub_extract.utils import strip_txn_base_path
 
 
 @pytest.mark.parametrize(
@@ -23,54 +22,56 @@ def test_parse_ofx_datetime(dt_str: str, expected: datetime.date):
     assert parse_ofx_datetime(dt_str) == expected
 
 
+EXPECTED_DOCFCU_OFX = [
+    Transaction(
+        extractor="docfcu_ofx",
+        file="docfcu.ofx",
+        lineno=1,
+        transaction_id="TEST2025-10-31Some(001)",
+        date=datetime.date(2025, 10, 31),
+        post_date=datetime.date(2025, 10, 31),
+        desc="DEPOSIT DIVIDEND 2.500% ANNUAL P",
+        amount=decimal.Decimal("100.00"),
+        type="CREDIT",
+        note="DEPOSIT DIVIDEND 2.500% ANNUAL PERCENTAGE YIELD EARNED 2.55% FROM 10/01/25 THROUGH 10/31/25",
+        currency="USD",
+        source_account="TEST123456S40",
+        extra={},
+    ),
+    Transaction(
+        extractor="docfcu_ofx",
+        file="docfcu.ofx",
+        lineno=2,
+        transaction_id="BALANCE_20251107164449",
+        date=datetime.date(2025, 11, 7),
+        post_date=datetime.date(2025, 11, 7),
+        desc="Balance as of 2025-11-07",
+        amount=decimal.Decimal("10000.00"),
+        type="BALANCE",
+        note=None,
+        currency="USD",
+        source_account="TEST123456S40",
+        extra={},
+    ),
+]
+
+
 @pytest.mark.parametrize(
     "input_file, expected",
     [
-        (
-            "docfcu.ofx",
-            [
-                Transaction(
-                    extractor="docfcu_ofx",
-                    file="docfcu.ofx",
-                    lineno=1,
-                    transaction_id="TEST2025-10-31Some(001)",
-                    date=datetime.date(2025, 10, 31),
-                    post_date=datetime.date(2025, 10, 31),
-                    desc="DEPOSIT DIVIDEND 2.500% ANNUAL P",
-                    amount=decimal.Decimal("100.00"),
-                    type="CREDIT",
-                    note="DEPOSIT DIVIDEND 2.500% ANNUAL PERCENTAGE YIELD EARNED 2.55% FROM 10/01/25 THROUGH 10/31/25",
-                    currency="USD",
-                    source_account="TEST123456S40",
-                    extra={},
-                ),
-                Transaction(
-                    extractor="docfcu_ofx",
-                    file="docfcu.ofx",
-                    lineno=2,
-                    transaction_id="BALANCE_20251107164449",
-                    date=datetime.date(2025, 11, 7),
-                    post_date=datetime.date(2025, 11, 7),
-                    desc="Balance as of 2025-11-07",
-                    amount=decimal.Decimal("10000.00"),
-                    type="BALANCE",
-                    note=None,
-                    currency="USD",
-                    source_account="TEST123456S40",
-                    extra={},
-                ),
-            ],
-        ),
+        ("docfcu.ofx", EXPECTED_DOCFCU_OFX),
     ],
 )
 def test_docfcu_ofx_extractor(
-    input_file: str, expected: list[Transaction], fixtures_folder: pathlib.Path
+    input_file: str,
+    expected: list[Transaction],
+    fixtures_folder: pathlib.Path,
+    extract_and_strip,
 ):
     input_file_path = fixtures_folder / input_file
     with input_file_path.open("rt") as fo:
         extractor = DocfcuOFXExtractor(fo)
-        result = list(extractor())
-        result = [strip_txn_base_path(fixtures_folder, txn) for txn in result]
+        result = extract_and_strip(extractor, fixtures_folder)
         assert result == expected
 
 
@@ -81,43 +82,17 @@ def test_docfcu_ofx_extractor(
             "docfcu.ofx",
             Fingerprint(
                 starting_date=datetime.date(2025, 10, 31),
-                first_row_hash="a1b2c3d4e5f6789012345678901234567890abcdef01234567890abcdef012345",
+                first_row_hash="41904d42a7064ce76db7e58967ece12e058c352caa7ae081e00344563f69aeb3",
             ),
         ),
     ],
 )
 def test_docfcu_ofx_fingerprint(
-    input_file: str, expected: Fingerprint, fixtures_folder: pathlib.Path
+    input_file: str, expected: Fingerprint, open_fixture
 ):
-    input_file_path = fixtures_folder / input_file
-    with input_file_path.open("rt") as fo:
+    with open_fixture(input_file) as fo:
         extractor = DocfcuOFXExtractor(fo)
         result = extractor.fingerprint()
-        assert result is not None
-        assert result.starting_date == expected.starting_date
-        assert len(result.first_row_hash) == 64  # SHA256 hash length
-
-
-@pytest.mark.parametrize(
-    "input_file, expected",
-    [
-        ("docfcu.ofx", True),
-        ("ussfcu.ofx", False),
-        ("ally_bank.qfx", False),
-        ("capital_one.ofx", False),
-        ("lfcu.ofx", False),
-        ("credit_human.ofx", False),
-        ("chase_credit_card.csv", False),
-        ("csv.csv", False),
-    ],
-)
-def test_docfcu_ofx_detect(
-    input_file: str, expected: bool, fixtures_folder: pathlib.Path
-):
-    input_file_path = fixtures_folder / input_file
-    with input_file_path.open("rt") as fo:
-        extractor = DocfcuOFXExtractor(fo)
-        result = extractor.detect()
         assert result == expected
 
 
@@ -129,4 +104,3 @@ def test_docfcu_ofx_extractor_name():
 def test_docfcu_ofx_import_id_template():
     """Test that the import ID template is correct."""
     assert DocfcuOFXExtractor.DEFAULT_IMPORT_ID == "docfcu:{{ source_account }}:{{ transaction_id }}"
-
@@ -8,7 +8,6 @@ from beanhub_extract.data_types import Fingerprint
 from beanhub_extract.data_types import Transaction
 from beanhub_extract.extractors.etrade_ofx import EtradeOFXExtractor
 from beanhub_extract.extractors.etrade_ofx import parse_ofx_datetime
-from beanhub_extract.utils import strip_txn_base_path
 
 
 @pytest.mark.parametrize(
@@ -23,84 +22,86 @@ def test_parse_ofx_datetime(dt_str: str, expected: datetime.date):
     assert parse_ofx_datetime(dt_str) == expected
 
 
+EXPECTED_ETRADE_OFX = [
+    Transaction(
+        extractor="etrade_ofx",
+        file="etrade.qfx",
+        lineno=1,
+        transaction_id="240301_INT_0",
+        date=datetime.date(2024, 3, 1),
+        post_date=datetime.date(2024, 3, 1),
+        desc="INT - SAMPLE BANK N.A.(Period 03/01-03/31)",
+        amount=decimal.Decimal("5.25"),
+        type="INCOME",
+        note=None,
+        currency="USD",
+        source_account="123456789",
+        extra={"cusip": "SAMPLEINT", "ticker": "SINT", "security_name": "Sample Interest Security"},
+    ),
+    Transaction(
+        extractor="etrade_ofx",
+        file="etrade.qfx",
+        lineno=2,
+        transaction_id="240310_B_0",
+        date=datetime.date(2024, 3, 10),
+        post_date=datetime.date(2024, 3, 10),
+        desc="SAMPLE TECH ETF DIVIDEND REINVESTMENT",
+        amount=decimal.Decimal("-525.00"),
+        type="BUYSTOCK",
+        note=None,
+        currency="USD",
+        source_account="123456789",
+        extra={"units": "10.5", "unitprice": "50.00", "cusip": "123456789", "ticker": "STECH", "security_name": "SAMPLE TECHNOLOGY ETF"},
+    ),
+    Transaction(
+        extractor="etrade_ofx",
+        file="etrade.qfx",
+        lineno=3,
+        transaction_id="240310_DIV_0",
+        date=datetime.date(2024, 3, 10),
+        post_date=datetime.date(2024, 3, 10),
+        desc="DIV - SAMPLE TECH ETF",
+        amount=decimal.Decimal("525.00"),
+        type="INCOME",
+        note=None,
+        currency="USD",
+        source_account="123456789",
+        extra={"cusip": "123456789", "ticker": "STECH", "security_name": "SAMPLE TECHNOLOGY ETF"},
+    ),
+    Transaction(
+        extractor="etrade_ofx",
+        file="etrade.qfx",
+        lineno=4,
+        transaction_id="BALANCE_20240315120000",
+        date=datetime.date(2024, 3, 15),
+        post_date=datetime.date(2024, 3, 15),
+        desc="Available Cash Balance as of 2024-03-15",
+        amount=decimal.Decimal("1250.75"),
+        type="BALANCE",
+        note=None,
+        currency="USD",
+        source_account="123456789",
+        extra={"ticker": "CASH", "security_name": "Cash Balance"},
+    ),
+]
+
+
 @pytest.mark.parametrize(
     "input_file, expected",
     [
-        (
-            "etrade.qfx",
-            [
-                Transaction(
-                    extractor="etrade_ofx",
-                    file="etrade.qfx",
-                    lineno=1,
-                    transaction_id="240301_INT_0",
-                    date=datetime.date(2024, 3, 1),
-                    post_date=datetime.date(2024, 3, 1),
-                    desc="INT - SAMPLE BANK N.A.(Period 03/01-03/31)",
-                    amount=decimal.Decimal("5.25"),
-                    type="INCOME",
-                    note=None,
-                    currency="USD",
-                    source_account="123456789",
-                    extra={"cusip": "SAMPLEINT", "ticker": "SINT", "security_name": "Sample Interest Security"},
-                ),
-                Transaction(
-                    extractor="etrade_ofx",
-                    file="etrade.qfx",
-                    lineno=2,
-                    transaction_id="240310_B_0",
-                    date=datetime.date(2024, 3, 10),
-                    post_date=datetime.date(2024, 3, 10),
-                    desc="SAMPLE TECH ETF DIVIDEND REINVESTMENT",
-                    amount=decimal.Decimal("-525.00"),
-                    type="BUYSTOCK",
-                    note=None,
-                    currency="USD",
-                    source_account="123456789",
-                    extra={"units": "10.5", "unitprice": "50.00", "cusip": "123456789", "ticker": "STECH", "security_name": "SAMPLE TECHNOLOGY ETF"},
-                ),
-                Transaction(
-                    extractor="etrade_ofx",
-                    file="etrade.qfx",
-                    lineno=3,
-                    transaction_id="240310_DIV_0",
-                    date=datetime.date(2024, 3, 10),
-                    post_date=datetime.date(2024, 3, 10),
-                    desc="DIV - SAMPLE TECH ETF",
-                    amount=decimal.Decimal("525.00"),
-                    type="INCOME",
-                    note=None,
-                    currency="USD",
-                    source_account="123456789",
-                    extra={"cusip": "123456789", "ticker": "STECH", "security_name": "SAMPLE TECHNOLOGY ETF"},
-                ),
-                Transaction(
-                    extractor="etrade_ofx",
-                    file="etrade.qfx",
-                    lineno=4,
-                    transaction_id="BALANCE_20240315120000",
-                    date=datetime.date(2024, 3, 15),
-                    post_date=datetime.date(2024, 3, 15),
-                    desc="Available Cash Balance as of 2024-03-15",
-                    amount=decimal.Decimal("1250.75"),
-                    type="BALANCE",
-                    note=None,
-                    currency="USD",
-                    source_account="123456789",
-                    extra={"ticker": "CASH", "security_name": "Cash Balance"},
-                ),
-            ],
-        ),
+        ("etrade.qfx", EXPECTED_ETRADE_OFX),
     ],
 )
 def test_etrade_ofx_extractor(
-    input_file: str, expected: list[Transaction], fixtures_folder: pathlib.Path
+    input_file: str,
+    expected: list[Transaction],
+    fixtures_folder: pathlib.Path,
+    extract_and_strip,
 ):
     input_file_path = fixtures_folder / input_file
     with input_file_path.open("rt") as fo:
         extractor = EtradeOFXExtractor(fo)
-        result = list(extractor())
-        result = [strip_txn_base_path(fixtures_folder, txn) for txn in result]
+        result = extract_and_strip(extractor, fixtures_folder)
         assert result == expected
 
 
@@ -111,39 +112,22 @@ def test_etrade_ofx_extractor(
             "etrade.qfx",
             Fingerprint(
                 starting_date=datetime.date(2024, 3, 1),
-                first_row_hash="test_hash",  # Will be checked for existence, not exact value
+                first_row_hash="6a122c14659eca44f323e137179885eaf9e7498644836da18c26d8c0c0e45434",
+            ),
+        ),
+        (
+            "etrade_no_memo.qfx",
+            Fingerprint(
+                starting_date=datetime.date(2024, 3, 1),
+                first_row_hash="844d72a34a3c5318bf65f3c668080d2c8ed176ce58b15367c410b551244aeadb",
             ),
         ),
     ],
 )
 def test_etrade_ofx_fingerprint(
-    input_file: str, expected: Fingerprint, fixtures_folder: pathlib.Path
+    input_file: str, expected: Fingerprint, open_fixture
 ):
-    input_file_path = fixtures_folder / input_file
-    with input_file_path.open("rt") as fo:
+    with open_fixture(input_file) as fo:
         extractor = EtradeOFXExtractor(fo)
         result = extractor.fingerprint()
-        # We can't predict the exact hash, so just check the date and that hash exists
-        assert result is not None
-        assert result.starting_date == expected.starting_date
-        assert len(result.first_row_hash) == 64  # SHA256 hash length
-
-
-@pytest.mark.parametrize(
-    "input_file, expected",
-    [
-        ("etrade.qfx", True),
-        ("ally_bank.qfx", False),
-        ("capital_one.ofx", False),
-        ("chase_credit_card.csv", False),
-        ("csv.csv", False),
-    ],
-)
-def test_etrade_ofx_detect(
-    input_file: str, expected: bool, fixtures_folder: pathlib.Path
-):
-    input_file_path = fixtures_folder / input_file
-    with input_file_path.open("rt") as fo:
-        extractor = EtradeOFXExtractor(fo)
-        result = extractor.detect()
         assert result == expected
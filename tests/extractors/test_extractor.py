@@ -3,6 +3,7 @@ import pathlib
 import pytest
 
 from beanhub_extract.extractors import detect_extractor
+from beanhub_extract.extractors import extract_batch
 
 
 @pytest.mark.parametrize(
@@ -25,3 +26,21 @@ def test_detect_extractor(
             assert extractor_cls is None
         else:
             assert extractor_cls.EXTRACTOR_NAME == extractor_name
+
+
+def test_extract_batch(fixtures_folder: pathlib.Path):
+    input_files = ["mercury.csv", "other.csv", "chase_credit_card.csv"]
+    expected = []
+    for input_file in input_files:
+        with open(fixtures_folder / input_file, "rt") as fo:
+            extractor_cls = detect_extractor(fo)
+            if extractor_cls is None:
+                continue
+            fo.seek(0)
+            expected.extend(extractor_cls(fo)())
+    result = list(
+        extract_batch(
+            [fixtures_folder / input_file for input_file in input_files], max_workers=2
+        )
+    )
+    assert result == expected
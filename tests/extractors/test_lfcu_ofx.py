@@ -9,7 +9,6 @@ from beanhub_extract.data_types import Fingerprint
 from beanhub_extract.data_types import Transaction
 from beanhub_extract.extractors.lfcu_ofx import LfcuOFXExtractor
 from beanhub_extract.extractors.lfcu_ofx import parse_ofx_datetime
-from beanhub_extract.utils import strip_txn_base_path
 
 
 @pytest.mark.parametrize(
@@ -24,99 +23,101 @@ def test_parse_ofx_datetime(dt_str: str, expected: datetime.date):
     assert parse_ofx_datetime(dt_str) == expected
 
 
+EXPECTED_LFCU_OFX = [
+    Transaction(
+        extractor="lfcu_ofx",
+        file="lfcu.ofx",
+        lineno=1,
+        transaction_id="100001",
+        date=datetime.date(2024, 8, 31),
+        post_date=datetime.date(2024, 8, 31),
+        desc="Dividend Deposit",
+        amount=decimal.Decimal("125.50"),
+        type="CREDIT",
+        note=None,
+        currency="USD",
+        source_account="1234567890-S0101",
+        extra={},
+    ),
+    Transaction(
+        extractor="lfcu_ofx",
+        file="lfcu.ofx",
+        lineno=2,
+        transaction_id="100002",
+        date=datetime.date(2024, 7, 31),
+        post_date=datetime.date(2024, 7, 31),
+        desc="Dividend Deposit",
+        amount=decimal.Decimal("123.75"),
+        type="CREDIT",
+        note=None,
+        currency="USD",
+        source_account="1234567890-S0101",
+        extra={},
+    ),
+    Transaction(
+        extractor="lfcu_ofx",
+        file="lfcu.ofx",
+        lineno=3,
+        transaction_id="100003",
+        date=datetime.date(2024, 7, 15),
+        post_date=datetime.date(2024, 7, 15),
+        desc="ATM Withdrawal",
+        amount=decimal.Decimal("-50.00"),
+        type="DEBIT",
+        note="ATM Transaction Fee",
+        currency="USD",
+        source_account="1234567890-S0101",
+        extra={},
+    ),
+    Transaction(
+        extractor="lfcu_ofx",
+        file="lfcu.ofx",
+        lineno=4,
+        transaction_id="100004",
+        date=datetime.date(2024, 6, 30),
+        post_date=datetime.date(2024, 6, 30),
+        desc="Dividend Deposit",
+        amount=decimal.Decimal("120.25"),
+        type="CREDIT",
+        note=None,
+        currency="USD",
+        source_account="1234567890-S0101",
+        extra={},
+    ),
+    Transaction(
+        extractor="lfcu_ofx",
+        file="lfcu.ofx",
+        lineno=5,
+        transaction_id="BALANCE_20240904205901",
+        date=datetime.date(2024, 9, 4),
+        post_date=datetime.date(2024, 9, 4),
+        desc="Balance as of 2024-09-04",
+        amount=decimal.Decimal("5432.10"),
+        type="BALANCE",
+        note=None,
+        currency="USD",
+        source_account="1234567890-S0101",
+        extra={},
+    ),
+]
+
+
 @pytest.mark.parametrize(
     "input_file, expected",
     [
-        (
-            "lfcu.ofx",
-            [
-                Transaction(
-                    extractor="lfcu_ofx",
-                    file="lfcu.ofx",
-                    lineno=1,
-                    transaction_id="100001",
-                    date=datetime.date(2024, 8, 31),
-                    post_date=datetime.date(2024, 8, 31),
-                    desc="Dividend Deposit",
-                    amount=decimal.Decimal("125.50"),
-                    type="CREDIT",
-                    note=None,
-                    currency="USD",
-                    source_account="1234567890-S0101",
-                    extra={},
-                ),
-                Transaction(
-                    extractor="lfcu_ofx",
-                    file="lfcu.ofx",
-                    lineno=2,
-                    transaction_id="100002",
-                    date=datetime.date(2024, 7, 31),
-                    post_date=datetime.date(2024, 7, 31),
-                    desc="Dividend Deposit",
-                    amount=decimal.Decimal("123.75"),
-                    type="CREDIT",
-                    note=None,
-                    currency="USD",
-                    source_account="1234567890-S0101",
-                    extra={},
-                ),
-                Transaction(
-                    extractor="lfcu_ofx",
-                    file="lfcu.ofx",
-                    lineno=3,
-                    transaction_id="100003",
-                    date=datetime.date(2024, 7, 15),
-                    post_date=datetime.date(2024, 7, 15),
-                    desc="ATM Withdrawal",
-                    amount=decimal.Decimal("-50.00"),
-                    type="DEBIT",
-                    note="ATM Transaction Fee",
-                    currency="USD",
-                    source_account="1234567890-S0101",
-                    extra={},
-                ),
-                Transaction(
-                    extractor="lfcu_ofx",
-                    file="lfcu.ofx",
-                    lineno=4,
-                    transaction_id="100004",
-                    date=datetime.date(2024, 6, 30),
-                    post_date=datetime.date(2024, 6, 30),
-                    desc="Dividend Deposit",
-                    amount=decimal.Decimal("120.25"),
-                    type="CREDIT",
-                    note=None,
-                    currency="USD",
-                    source_account="1234567890-S0101",
-                    extra={},
-                ),
-                Transaction(
-                    extractor="lfcu_ofx",
-                    file="lfcu.ofx",
-                    lineno=5,
-                    transaction_id="BALANCE_20240904205901",
-                    date=datetime.date(2024, 9, 4),
-                    post_date=datetime.date(2024, 9, 4),
-                    desc="Balance as of 2024-09-04",
-                    amount=decimal.Decimal("5432.10"),
-                    type="BALANCE",
-                    note=None,
-                    currency="USD",
-                    source_account="1234567890-S0101",
-                    extra={},
-                ),
-            ],
-        ),
+        ("lfcu.ofx", EXPECTED_LFCU_OFX),
     ],
 )
 def test_lfcu_ofx_extractor(
-    input_file: str, expected: list[Transaction], fixtures_folder: pathlib.Path
+    input_file: str,
+    expected: list[Transaction],
+    fixtures_folder: pathlib.Path,
+    extract_and_strip,
 ):
     input_file_path = fixtures_folder / input_file
     with input_file_path.open("rt") as fo:
         extractor = LfcuOFXExtractor(fo)
-        result = list(extractor())
-        result = [strip_txn_base_path(fixtures_folder, txn) for txn in result]
+        result = extract_and_strip(extractor, fixtures_folder)
         assert result == expected
 
 
@@ -127,39 +128,22 @@ def test_lfcu_ofx_extractor(
             "lfcu.ofx",
             Fingerprint(
                 starting_date=datetime.date(2024, 8, 31),
-                first_row_hash="a8b9c0d1e2f3456789abcdef01234567890abcdef01234567890abcdef012345",
+                first_row_hash="5a29d81f07946f90803fad2f94554f1ce717c2b548d1935bb040cc5c0a9776df",
+            ),
+        ),
+        (
+            "lfcu_no_name.ofx",
+            Fingerprint(
+                starting_date=datetime.date(2024, 8, 31),
+                first_row_hash="38075768316cd5eeaf1f9b29eb7196a3534087d07d09a87901b0f341a95769a9",
             ),
         ),
     ],
 )
 def test_lfcu_ofx_fingerprint(
-    input_file: str, expected: Fingerprint, fixtures_folder: pathlib.Path
+    input_file: str, expected: Fingerprint, open_fixture
 ):
-    input_file_path = fixtures_folder / input_file
-    with input_file_path.open("rt") as fo:
+    with open_fixture(input_file) as fo:
         extractor = LfcuOFXExtractor(fo)
         result = extractor.fingerprint()
-        # We can't predict the exact hash, so just check the date and that hash exists
-        assert result is not None
-        assert result.starting_date == expected.starting_date
-        assert len(result.first_row_hash) == 64  # SHA256 hash length
-
-
-@pytest.mark.parametrize(
-    "input_file, expected",
-    [
-        ("lfcu.ofx", True),
-        ("ally_bank.qfx", False),
-        ("capital_one.ofx", False),
-        ("chase_credit_card.csv", False),
-        ("csv.csv", False),
-    ],
-)
-def test_lfcu_ofx_detect(
-    input_file: str, expected: bool, fixtures_folder: pathlib.Path
-):
-    input_file_path = fixtures_folder / input_file
-    with input_file_path.open("rt") as fo:
-        extractor = LfcuOFXExtractor(fo)
-        result = extractor.detect()
         assert result == expected
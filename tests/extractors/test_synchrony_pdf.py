@@ -9,85 +9,80 @@ from beanhub_extract.extractors.synchrony_pdf import SynchronyPdfExtractor
 from beanhub_extract.utils import strip_txn_base_path
 
 
-@pytest.mark.parametrize(
-    "input_file, expected",
-    [
-        (
-            "synchrony.pdf",
-            [
-                Transaction(
-                    extractor="synchrony_pdf",
-                    file="synchrony.pdf",
-                    lineno=1,
-                    reversed_lineno=-3,
-                    date=datetime.date(2024, 3, 15),
-                    desc="INTEREST ADDED",
-                    amount=decimal.Decimal("50.25"),
-                    currency="USD",
-                    source_account="9999",
-                ),
-                Transaction(
-                    extractor="synchrony_pdf",
-                    file="synchrony.pdf",
-                    lineno=2,
-                    reversed_lineno=-2,
-                    date=datetime.date(2024, 2, 15),
-                    desc="INTEREST ADDED",
-                    amount=decimal.Decimal("48.75"),
-                    currency="USD",
-                    source_account="9999",
-                ),
-                Transaction(
-                    extractor="synchrony_pdf",
-                    file="synchrony.pdf",
-                    lineno=3,
-                    reversed_lineno=-1,
-                    date=datetime.date(2024, 1, 15),
-                    desc="DEPOSIT",
-                    amount=decimal.Decimal("10000.00"),
-                    currency="USD",
-                    source_account="9999",
-                ),
-                Transaction(
-                    extractor="synchrony_pdf",
-                    file="synchrony.pdf",
-                    lineno=4,
-                    reversed_lineno=0,
-                    transaction_id="BALANCE_2024-03-16",
-                    date=datetime.date(2024, 3, 16),
-                    desc="Balance as of 2024-03-16",
-                    amount=decimal.Decimal("10099.00"),
-                    currency="USD",
-                    type="BALANCE",
-                    source_account="9999",
-                ),
-            ],
-        ),
-    ],
-)
-def test_synchrony_pdf_extractor(
-    input_file: str, expected: list[Transaction], fixtures_folder: pathlib.Path
-):
-    input_file_path = fixtures_folder / input_file
-    with input_file_path.open("rb") as fo:
-        extractor = SynchronyPdfExtractor(fo)
-        result = list(extractor())
-        result = [strip_txn_base_path(fixtures_folder, txn) for txn in result]
-        assert result == expected
+EXPECTED_SYNCHRONY_PDF = [
+    Transaction(
+        extractor="synchrony_pdf",
+        file="synchrony.pdf",
+        lineno=1,
+        reversed_lineno=-3,
+        date=datetime.date(2024, 3, 15),
+        desc="INTEREST ADDED",
+        amount=decimal.Decimal("50.25"),
+        currency="USD",
+        source_account="9999",
+    ),
+    Transaction(
+        extractor="synchrony_pdf",
+        file="synchrony.pdf",
+        lineno=2,
+        reversed_lineno=-2,
+        date=datetime.date(2024, 2, 15),
+        desc="INTEREST ADDED",
+        amount=decimal.Decimal("48.75"),
+        currency="USD",
+        source_account="9999",
+    ),
+    Transaction(
+        extractor="synchrony_pdf",
+        file="synchrony.pdf",
+        lineno=3,
+        reversed_lineno=-1,
+        date=datetime.date(2024, 1, 15),
+        desc="DEPOSIT",
+        amount=decimal.Decimal("10000.00"),
+        currency="USD",
+        source_account="9999",
+    ),
+    Transaction(
+        extractor="synchrony_pdf",
+        file="synchrony.pdf",
+        lineno=4,
+        reversed_lineno=0,
+        transaction_id="BALANCE_2024-03-16",
+        date=datetime.date(2024, 3, 16),
+        desc="Balance as of 2024-03-16",
+        amount=decimal.Decimal("10099.00"),
+        currency="USD",
+        type="BALANCE",
+        source_account="9999",
+    ),
+]
+
+
+@pytest.fixture(scope="session")
+def synchrony_transactions(fixtures_folder: pathlib.Path) -> list[Transaction]:
+    """Transactions extracted from synchrony.pdf, parsed once per session."""
+    with (fixtures_folder / "synchrony.pdf").open("rb") as fo:
+        return [
+            strip_txn_base_path(fixtures_folder, txn)
+            for txn in SynchronyPdfExtractor(fo)()
+        ]
+
+
+def test_synchrony_pdf_extractor(synchrony_transactions: list[Transaction]):
+    assert synchrony_transactions == EXPECTED_SYNCHRONY_PDF
 
 
-def test_synchrony_pdf_detect(fixtures_folder: pathlib.Path):
+def test_synchrony_pdf_detect(open_fixture):
     """Test detection of Synchrony PDF files"""
-    input_file_path = fixtures_folder / "synchrony.pdf"
-    with input_file_path.open("rb") as fo:
+    with open_fixture("synchrony.pdf", "rb") as fo:
         extractor = SynchronyPdfExtractor(fo)
         assert extractor.detect() is True
 
 
-def test_synchrony_pdf_fingerprint(fixtures_folder: pathlib.Path):
+def test_synchrony_pdf_fingerprint(open_fixture):
     """Test fingerprint generation for Synchrony PDF files"""
-    input_file_path = fixtures_folder / "synchrony.pdf"
-    with input_file_path.open("rb") as fo:
+    with open_fixture("synchrony.pdf", "rb") as fo:
         extractor = SynchronyPdfExtractor(fo)
         fingerprint = extractor.fingerprint()
         assert fingerprint is not None
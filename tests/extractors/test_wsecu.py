@@ -3,10 +3,30 @@ import decimal
 import io
 import pytest
 
+from beanhub_extract.data_types import Fingerprint
 from beanhub_extract.extractors.wsecu import WSECUExtractor
+from beanhub_extract.extractors.wsecu import parse_date
 
 
-@pytest.fixture
+@pytest.mark.parametrize(
+    "date_str, expected",
+    [
+        ("08/15/2024", datetime.date(2024, 8, 15)),
+        ("12/01/2023", datetime.date(2023, 12, 1)),
+        ("8/5/2024", datetime.date(2024, 8, 5)),
+    ],
+)
+def test_parse_date(date_str: str, expected: datetime.date):
+    assert parse_date(date_str) == expected
+
+
+@pytest.mark.parametrize("date_str", ["invalid-date", "08-15-2024", "13/15/2024"])
+def test_parse_date_invalid(date_str: str):
+    with pytest.raises((ValueError, IndexError)):
+        parse_date(date_str)
+
+
+@pytest.fixture(scope="session")
 def wsecu_csv_content():
     return """Account number,Date,Description,Category,Note,Amount,Balance
 1234567890-S01,08/15/2024,DIGITAL DEPOSIT FROM SHARE 01,Transfer,,500.00,1250.00
@@ -21,6 +41,12 @@ def wsecu_csv_content():
 1234567890-S01,07/05/2024,SERVICE FEE,Fees Charges,,-15.00,-3053.08"""
 
 
+@pytest.fixture(scope="session")
+def wsecu_transactions(wsecu_csv_content):
+    """Transactions extracted from wsecu_csv_content, parsed once per session."""
+    return list(WSECUExtractor(io.StringIO(wsecu_csv_content))())
+
+
 @pytest.fixture
 def invalid_csv_content():
     return """Wrong,Headers,Format
@@ -57,10 +83,10 @@ class TestWSECUExtractor:
         extractor = WSECUExtractor(input_file)
         fingerprint = extractor.fingerprint()
         
-        assert fingerprint is not None
-        assert fingerprint.starting_date == datetime.date(2024, 8, 15)  # First row date (most recent)
-        assert isinstance(fingerprint.first_row_hash, str)
-        assert len(fingerprint.first_row_hash) == 64  # SHA256 hash length
+        assert fingerprint == Fingerprint(
+            starting_date=datetime.date(2024, 8, 15),  # First row date (most recent)
+            first_row_hash="bfa64a4cb35915d4f03f68d535aeeadd6513de28bce46a833561e4456716f546",
+        )
 
     def test_fingerprint_empty_csv(self, empty_csv_content):
         """Test fingerprint returns None for empty CSV."""
@@ -70,11 +96,9 @@ class TestWSECUExtractor:
         
         assert fingerprint is None
 
-    def test_extract_transactions(self, wsecu_csv_content):
+    def test_extract_transactions(self, wsecu_transactions):
         """Test transaction extraction from WSECU CSV."""
-        input_file = io.StringIO(wsecu_csv_content)
-        extractor = WSECUExtractor(input_file)
-        transactions = list(extractor())
+        transactions = wsecu_transactions
         
         # Should have 10 regular transactions + 1 balance transaction = 11 total
         assert len(transactions) == 11
@@ -119,11 +143,9 @@ class TestWSECUExtractor:
         regular_txn = transactions[0]
         assert regular_txn.category is None
 
-    def test_balance_transaction_creation(self, wsecu_csv_content):
+    def test_balance_transaction_creation(self, wsecu_transactions):
         """Test balance transaction is created correctly."""
-        input_file = io.StringIO(wsecu_csv_content)
-        extractor = WSECUExtractor(input_file)
-        transactions = list(extractor())
+        transactions = wsecu_transactions
         
         # Balance transaction should be the last one
         balance_txn = transactions[-1]
@@ -193,11 +215,9 @@ class TestWSECUExtractor:
         assert WSECUExtractor.EXTRACTOR_NAME == "wsecu"
         assert WSECUExtractor.DEFAULT_IMPORT_ID == "wsecu:{{ source_account }}:{{ reversed_lineno }}"
 
-    def test_import_id_format_with_transaction_data(self, wsecu_csv_content):
+    def test_import_id_format_with_transaction_data(self, wsecu_transactions):
         """Test that transactions have the correct source_account for import ID generation."""
-        input_file = io.StringIO(wsecu_csv_content)
-        extractor = WSECUExtractor(input_file)
-        transactions = list(extractor())
+        transactions = wsecu_transactions
         
         # Test regular transactions have correct source_account and reversed_lineno
         regular_txns = [t for t in transactions if t.type != "BALANCE"]
@@ -3,6 +3,7 @@ import pathlib
 import pytest
 
 from beanhub_extract.data_types import Transaction
+from beanhub_extract.utils import split_slash_date
 from beanhub_extract.utils import strip_base_path
 from beanhub_extract.utils import strip_txn_base_path
 
@@ -37,3 +38,17 @@ def test_strip_txn_base_path(base_path: str, txn: Transaction, expected: Transac
         strip_txn_base_path(pathlib.PurePosixPath(base_path), txn, pure_posix=True)
         == expected
     )
+
+
+@pytest.mark.parametrize(
+    "date_str, expected",
+    [
+        ("08/31/2025", (8, 31, 2025)),
+        ("31/08/2025", (31, 8, 2025)),
+        ("08/31/25", (8, 31, 25)),
+        ("8/1/2025", (8, 1, 2025)),
+        ("1/15/24", (1, 15, 24)),
+    ],
+)
+def test_split_slash_date(date_str: str, expected: tuple[int, int, int]):
+    assert split_slash_date(date_str) == expected